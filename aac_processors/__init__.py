@@ -1,16 +1,16 @@
-from typing import TYPE_CHECKING
-
-from . import viewer
-from .coughdrop_processor import CoughDropProcessor
-from .dot_processor import DotProcessor
-from .gridset_processor import GridsetProcessor
-from .opml_processor import OPMLProcessor
-from .snap_processor import SnapProcessor
-from .touchchat_processor import TouchChatProcessor
-from .tree_structure import AACButton, AACPage, AACTree, ButtonType
+import importlib
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from . import viewer
+    from .coughdrop_processor import CoughDropProcessor
+    from .dot_processor import DotProcessor
+    from .gridset_processor import GridsetProcessor
+    from .opml_processor import OPMLProcessor
     from .optional.screenshot_processor import ScreenshotProcessor
+    from .snap_processor import SnapProcessor
+    from .touchchat_processor import TouchChatProcessor
+    from .tree_structure import AACButton, AACPage, AACTree, ButtonType
 
 __all__ = [
     "GridsetProcessor",
@@ -28,6 +28,55 @@ __all__ = [
     "get_screenshot_processor",
 ]
 
+# Public name -> module that defines it. Resolved on first attribute access so
+# that ``import aac_processors`` does not pull in every processor up front.
+_LAZY_ATTRS = {
+    "GridsetProcessor": ".gridset_processor",
+    "TouchChatProcessor": ".touchchat_processor",
+    "SnapProcessor": ".snap_processor",
+    "CoughDropProcessor": ".coughdrop_processor",
+    "OPMLProcessor": ".opml_processor",
+    "DotProcessor": ".dot_processor",
+    "AACTree": ".tree_structure",
+    "AACPage": ".tree_structure",
+    "AACButton": ".tree_structure",
+    "ButtonType": ".tree_structure",
+    "ScreenshotProcessor": ".optional.screenshot_processor",
+}
+
+# Submodules exposed as package attributes
+_LAZY_SUBMODULES = {"viewer": ".viewer"}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names lazily on first access.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The requested class or submodule
+
+    Raises:
+        AttributeError: If the name is not part of the public API
+    """
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(_LAZY_SUBMODULES[name], __name__)
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not yet loaded."""
+    return sorted(set(globals()) | set(__all__))
+
 
 def get_screenshot_processor() -> "ScreenshotProcessor":
     """Lazy load the screenshot processor.
@@ -0,0 +1,52 @@
+"""JSON reading and writing backed by orjson when it is installed.
+
+orjson parses and serializes OBF boards several times faster than the
+standard library. It is optional: without it, or for data orjson refuses
+(``NaN`` literals when reading, integers wider than 64 bits when writing),
+the ``json`` module is used instead.
+"""
+
+import json
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes) -> Any:
+    """Parse a JSON document from UTF-8 bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load(fp: IO[bytes]) -> Any:
+    """Parse a JSON document from a file opened in binary mode."""
+    return loads(fp.read())
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, optionally indented by two.
+
+    Without indent the output has no whitespace at all, as orjson writes it.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def dump(obj: Any, fp: IO[bytes], indent: bool = False) -> None:
+    """Serialize an object to a file opened in binary mode."""
+    fp.write(dumps(obj, indent))
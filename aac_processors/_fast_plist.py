@@ -0,0 +1,157 @@
+"""lxml-backed reader for XML property lists.
+
+Produces the same objects as ``plistlib.load`` for XML plists but leaves the
+XML tokenising to libxml2, which is noticeably faster on large
+PanelDefinitions.plist files. Binary plists are handed to ``plistlib``.
+"""
+
+import base64
+import plistlib
+import re
+from datetime import datetime
+from typing import IO, Any, Optional
+
+from lxml import etree
+
+BINARY_PLIST_MAGIC = b"bplist00"
+
+# Same grammar plistlib accepts: a date may be truncated after any component
+_DATE_RE = re.compile(
+    r"(?P<year>\d\d\d\d)"
+    r"(?:-(?P<month>\d\d)"
+    r"(?:-(?P<day>\d\d)"
+    r"(?:T(?P<hour>\d\d)"
+    r"(?::(?P<minute>\d\d)"
+    r"(?::(?P<second>\d\d))"
+    r"?)?)?)?)?Z",
+    re.ASCII,
+)
+
+
+def _parse_date(text: str) -> datetime:
+    """Parse an ISO 8601 plist date into a naive UTC datetime.
+
+    Args:
+        text: Contents of a <date> element
+
+    Returns:
+        Parsed datetime
+    """
+    match = _DATE_RE.match(text)
+    if not match:
+        raise ValueError(f"Invalid plist date: {text!r}")
+    parts = [int(value) for value in match.groups() if value is not None]
+    # Missing month/day default to 1, missing time components to 0
+    while len(parts) < 3:
+        parts.append(1)
+    return datetime(*parts)
+
+
+class _PlistEventHandler:
+    """Builds Python objects from start/end events of a plist document."""
+
+    def __init__(self) -> None:
+        self.stack: list[Any] = []
+        self.current_key: Optional[str] = None
+        self.root: Any = None
+
+    def _add_object(self, value: Any) -> None:
+        if self.current_key is not None:
+            if not isinstance(self.stack[-1], dict):
+                raise ValueError("Unexpected key in plist")
+            self.stack[-1][self.current_key] = value
+            self.current_key = None
+        elif not self.stack:
+            self.root = value
+        else:
+            if not isinstance(self.stack[-1], list):
+                raise ValueError("Unexpected element in plist dict")
+            self.stack[-1].append(value)
+
+    def start(self, tag: str) -> None:
+        if tag == "dict":
+            value: Any = {}
+        elif tag == "array":
+            value = []
+        else:
+            return
+        self._add_object(value)
+        self.stack.append(value)
+
+    def end(self, tag: str, text: Optional[str]) -> None:
+        if tag in ("dict", "array"):
+            if tag == "dict" and self.current_key is not None:
+                raise ValueError(f"Missing value for key {self.current_key!r}")
+            self.stack.pop()
+        elif tag == "key":
+            if self.current_key is not None or not isinstance(
+                self.stack[-1] if self.stack else None, dict
+            ):
+                raise ValueError("Unexpected key in plist")
+            self.current_key = text or ""
+        elif tag == "string":
+            self._add_object(text or "")
+        elif tag == "integer":
+            raw = (text or "").strip()
+            if raw.startswith(("0x", "0X")):
+                self._add_object(int(raw, 16))
+            else:
+                self._add_object(int(raw))
+        elif tag == "real":
+            self._add_object(float(text or ""))
+        elif tag == "true":
+            self._add_object(True)
+        elif tag == "false":
+            self._add_object(False)
+        elif tag == "date":
+            self._add_object(_parse_date(text or ""))
+        elif tag == "data":
+            self._add_object(base64.b64decode((text or "").encode("ascii")))
+        elif tag != "plist":
+            raise ValueError(f"Unsupported plist element: {tag}")
+
+
+def load_xml(fp: IO[bytes]) -> Any:
+    """Parse an XML plist from a binary file object.
+
+    Args:
+        fp: File object opened in binary mode
+
+    Returns:
+        The top-level plist object
+    """
+    handler = _PlistEventHandler()
+    # Comments and processing instructions are dropped while parsing so text
+    # split by them is merged, as plistlib does. libxml2's default size and
+    # depth limits stay on, so a hostile file cannot exhaust memory.
+    for event, element in etree.iterparse(
+        fp,
+        events=("start", "end"),
+        resolve_entities=False,
+        no_network=True,
+        remove_comments=True,
+        remove_pis=True,
+    ):
+        if event == "start":
+            handler.start(element.tag)
+        else:
+            handler.end(element.tag, element.text)
+            # Values are copied into Python objects, the tree is not needed
+            element.clear()
+    return handler.root
+
+
+def load(fp: IO[bytes]) -> Any:
+    """Parse a plist, using lxml for XML and plistlib for binary files.
+
+    Args:
+        fp: Seekable file object opened in binary mode
+
+    Returns:
+        The top-level plist object
+    """
+    header = fp.read(len(BINARY_PLIST_MAGIC))
+    fp.seek(0)
+    if header == BINARY_PLIST_MAGIC:
+        return plistlib.load(fp, fmt=plistlib.FMT_BINARY)
+    return load_xml(fp)
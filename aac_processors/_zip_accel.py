@@ -0,0 +1,59 @@
+"""Optional ISA-L acceleration for zipfile's DEFLATE streams.
+
+When python-isal is installed, archives opened through this module's ZipFile
+have their DEFLATE streams served by ``isal.isal_zlib``, which produces and
+reads the same raw DEFLATE streams two to three times faster than zlib. ISA-L
+only implements levels 0-3, so members written at any other level (including
+zlib's default) keep using zlib. Only these ZipFile objects are affected; the
+zipfile module itself is left alone, so archives opened elsewhere in the
+process never see isal. Without isal this ZipFile behaves exactly like
+zipfile.ZipFile.
+"""
+
+import zipfile
+from typing import IO, Any, Optional, Union
+
+try:
+    from isal import isal_zlib
+except ImportError:  # Optional dependency
+    isal_zlib = None
+
+# zipfile stores raw DEFLATE streams, without a zlib header
+_RAW_DEFLATE_WBITS = -15
+
+
+class ZipFile(zipfile.ZipFile):
+    """zipfile.ZipFile that uses isal for DEFLATE members when available."""
+
+    def open(
+        self,
+        name: Union[str, zipfile.ZipInfo],
+        mode: str = "r",
+        pwd: Optional[bytes] = None,
+        *,
+        force_zip64: bool = False,
+    ) -> IO[bytes]:
+        """Open a member, swapping in isal's (de)compressor where it applies.
+
+        The stream objects create their zlib (de)compressor up front but use
+        it only once data flows, so it can be replaced right after opening.
+        """
+        handle: Any = super().open(
+            name, mode, pwd, force_zip64=force_zip64  # type: ignore[arg-type]
+        )
+        if isal_zlib is None:
+            return handle
+        if mode == "w":
+            info = handle._zinfo
+            level = info._compresslevel
+            if (
+                info.compress_type == zipfile.ZIP_DEFLATED
+                and level is not None
+                and 0 <= level <= isal_zlib.ISAL_BEST_COMPRESSION
+            ):
+                handle._compressor = isal_zlib.compressobj(
+                    level, isal_zlib.DEFLATED, _RAW_DEFLATE_WBITS
+                )
+        elif handle._compress_type == zipfile.ZIP_DEFLATED:
+            handle._decompressor = isal_zlib.decompressobj(_RAW_DEFLATE_WBITS)
+        return handle
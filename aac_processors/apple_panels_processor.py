@@ -1,13 +1,126 @@
 """Processor for Apple Panels format (.ascconfig)."""
 
+import importlib
 import os
 import plistlib
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType, ModuleType
 from typing import Any, Optional
 
+from ._fast_plist import BINARY_PLIST_MAGIC
+from ._fast_plist import load as _pload
 from .file_processor import FileProcessor
 from .tree_structure import AACButton, AACPage, AACTree, ButtonStyle, ButtonType
 
+# Upper bound on concurrent image downloads in save_from_tree
+_MAX_DOWNLOAD_WORKERS = 16
+# Seconds to wait for a connection or for data from an image host
+_DOWNLOAD_TIMEOUT = 30
+
+# requests is only needed when a button references a remote image, so it is
+# imported on first use rather than at module load.
+_requests: Optional[ModuleType] = None
+
+
+def _get_requests() -> ModuleType:
+    """Import and cache the requests module on first use.
+
+    Returns:
+        The requests module
+
+    Raises:
+        ImportError: If requests is not installed
+    """
+    global _requests
+    if _requests is None:
+        try:
+            _requests = importlib.import_module("requests")
+        except ImportError as e:
+            raise ImportError(
+                "Downloading button images requires the requests package. "
+                "Install it with: pip install requests"
+            ) from e
+    return _requests
+
+
+# Apple color component string for every byte value, e.g. 128 -> "0.502"
+_BYTE_TO_STR = tuple(f"{i / 255:.3f}" for i in range(256))
+
+# Translation table removing the braces from "{{x, y}, {w, h}}" rect strings
+_RECT_BRACES = str.maketrans("", "", "{}")
+
+
+# Panels reuse a handful of colours across many buttons, so the conversions
+# below are memoized.
+@lru_cache(maxsize=256)
+def _apple_color_to_hex(color_str: str) -> str:
+    """Convert an Apple "r g b a" color string to "#RRGGBB"."""
+    try:
+        # Split color components and convert to 0-255 range
+        r, g, b, _ = [float(x) for x in color_str.split()]
+        return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+    except (ValueError, IndexError):
+        return "#ffffff"  # Default to white
+
+
+@lru_cache(maxsize=256)
+def _hex_to_apple_color(hex_color: str) -> str:
+    """Convert a "#RRGGBB" color to an Apple "r g b a" color string."""
+    try:
+        # Remove # and parse the three RGB bytes in one call
+        r, g, b = bytes.fromhex(hex_color.lstrip("#")[:6])
+        # Convert to 0-1 range and add alpha
+        return f"{_BYTE_TO_STR[r]} {_BYTE_TO_STR[g]} {_BYTE_TO_STR[b]} 1.000"
+    except ValueError:
+        return "1.000 1.000 1.000 1.000"  # Default white
+
+
+# Fixed attributes of every generated panel and button; copied per object
+_PANEL_TEMPLATE: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "DisplayOrder": 1,
+        "GlidingLensSize": 5,
+        "HasTransientPosition": False,
+        "HideHome": False,
+        "HideMinimize": False,
+        "HidePanelAdjustments": False,
+        "HideSwitchDock": False,
+        "HideSwitchDockContextualButtons": False,
+        "HideTitlebar": False,
+        "ProductSupportType": "All",
+        "Rect": "{{15, 75}, {425, 55}}",
+        "ScanStyle": 0,
+        "ShowPanelLocationString": "CustomPanelList",
+        "UsesPinnedResizing": False,
+    }
+)
+_BUTTON_TEMPLATE: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "ButtonType": 0,
+        "DisplayImageResourceIsTemplate": False,
+        "DisplayImageWeight": "FontWeightRegular",
+        "FontSize": 12,
+        "PanelObjectType": "Button",
+    }
+)
+
+
+def _write_plist(path: Path, data: Any, fmt: plistlib.PlistFormat) -> None:
+    """Serialize a plist in memory and write it with a single call.
+
+    Args:
+        path: Destination file
+        data: Plist data to write
+        fmt: plistlib.FMT_BINARY or plistlib.FMT_XML
+    """
+    with open(path, "wb") as f:
+        f.write(plistlib.dumps(data, fmt=fmt, sort_keys=False))
+
 
 class ApplePanelsProcessor(FileProcessor):
     """Process Apple Panels format (.ascconfig folders)."""
@@ -41,43 +154,9 @@ class ApplePanelsProcessor(FileProcessor):
             Parsed plist data as dictionary
         """
         with open(file_path, "rb") as f:
-            return plistlib.load(f)
-
-    def _extract_button_info(
-        self, button_dict: dict[str, Any]
-    ) -> tuple[str, str, str, tuple[int, int]]:
-        """Extract button information from button dictionary.
-
-        Args:
-            button_dict: Dictionary containing button data
-
-        Returns:
-            Tuple of (id, text, color, position)
-        """
-        # Extract button ID
-        button_id = button_dict.get("ID", "")
-
-        # Get display text
-        text = button_dict.get("DisplayText", "")
-
-        # Get color (default to white if not specified)
-        color = button_dict.get("DisplayColor", "1.000 1.000 1.000 1.000")
-
-        # Parse rect string like "{{x, y}, {w, h}}"
-        rect_str = button_dict.get("Rect", "{{0, 0}, {0, 0}}")
-        try:
-            # Remove braces and split
-            rect_parts = rect_str.replace("{", "").replace("}", "").split(",")
-            x = int(float(rect_parts[0]))
-            y = int(float(rect_parts[1]))
-            # Calculate grid position based on coordinates
-            # Assuming standard button size of 100x25
-            row = y // 100
-            col = x // 100
-        except (ValueError, IndexError):
-            row, col = 0, 0
-
-        return button_id, text, color, (row, col)
+            # Dispatches on the binary header rather than letting plistlib
+            # probe each format in turn
+            return _pload(f)
 
     def _convert_color(self, color_str: str) -> str:
         """Convert color string from Apple format to hex.
@@ -88,44 +167,54 @@ class ApplePanelsProcessor(FileProcessor):
         Returns:
             Hex color string like "#RRGGBB"
         """
-        try:
-            # Split color components and convert to 0-255 range
-            r, g, b, _ = [float(x) for x in color_str.split()]
-            return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
-        except (ValueError, IndexError):
-            return "#ffffff"  # Default to white
+        return _apple_color_to_hex(color_str)
 
-    def load_into_tree(self, file_path: str) -> AACTree:
-        """Load Apple Panels config into tree structure.
+    def _get_panels_path(self, file_path: str) -> Path:
+        """Validate config layout and locate its panel definitions.
 
         Args:
             file_path: Path to .ascconfig folder
 
         Returns:
-            Tree structure containing pages and buttons
-        """
-        tree = AACTree()
+            Path to Contents/Resources/PanelDefinitions.plist
 
-        # Check paths
+        Raises:
+            ValueError: If the config is missing required files
+        """
         contents_dir = Path(file_path) / "Contents"
         if not contents_dir.exists():
             msg = f"Invalid Apple Panels config - no Contents directory in {file_path}"
             raise ValueError(msg)
 
-        # Load Info.plist
-        info_path = contents_dir / "Info.plist"
-        if not info_path.exists():
+        if not (contents_dir / "Info.plist").exists():
             raise ValueError(f"Missing Info.plist in {file_path}")
 
-        self._load_plist(str(info_path))
-
-        # Load panel definitions
         panels_path = contents_dir / "Resources" / "PanelDefinitions.plist"
         if not panels_path.exists():
             raise ValueError(f"Missing PanelDefinitions.plist in {file_path}")
 
+        return panels_path
+
+    def load_into_tree(self, file_path: str) -> AACTree:
+        """Load Apple Panels config into tree structure.
+
+        Args:
+            file_path: Path to .ascconfig folder
+
+        Returns:
+            Tree structure containing pages and buttons
+        """
+        tree = AACTree()
+
+        panels_path = self._get_panels_path(file_path)
+        self._load_plist(str(panels_path.parent.parent / "Info.plist"))
         panels = self._load_plist(str(panels_path))
 
+        # Loop-invariant lookups bound once
+        speak = ButtonType.SPEAK
+        navigate = ButtonType.NAVIGATE
+        to_hex = _apple_color_to_hex
+
         # Process each panel
         for panel_id, panel_data in panels.get("Panels", {}).items():
             # Create page for panel
@@ -135,40 +224,54 @@ class ApplePanelsProcessor(FileProcessor):
                 grid_size=(0, 0),  # Will be calculated from buttons
             )
 
-            # Process buttons
+            # Process buttons in a single pass, tracking grid size as we go
             max_row = 0
             max_col = 0
-            for button_data in panel_data.get("PanelObjects", []):
-                if button_data.get("PanelObjectType") == "Button":
-                    # Extract button info
-                    btn_id, text, color, pos = self._extract_button_info(button_data)
-                    row, col = pos
-
-                    # Track grid size
-                    max_row = max(max_row, row)
-                    max_col = max(max_col, col)
-
-                    # Create button
-                    btn = AACButton(
-                        id=btn_id,
-                        label=text,
-                        type=ButtonType.SPEAK,  # Default to speak
-                        position=pos,
-                        style=ButtonStyle(body_color=self._convert_color(color)),
-                    )
-
-                    # Check for navigation action
-                    actions = button_data.get("Actions", [])
-                    for action in actions:
-                        if action.get("ActionType") == "ActionOpenPanel":
-                            btn.type = ButtonType.NAVIGATE
-                            target = action.get("ActionParam", {})
-                            btn.target_page_id = target.get("PanelID")
-                        elif action.get("ActionType") == "ActionPressKeyCharSequence":
-                            params = action.get("ActionParam", {})
-                            btn.vocalization = params.get("CharString", text)
-
-                    page.buttons.append(btn)
+            append_button = page.buttons.append
+            for button_data in panel_data.get("PanelObjects", ()):
+                if button_data.get("PanelObjectType") != "Button":
+                    continue
+
+                text = button_data.get("DisplayText", "")
+                # Default to white if not specified
+                color = button_data.get("DisplayColor", "1.000 1.000 1.000 1.000")
+
+                # Parse rect string like "{{x, y}, {w, h}}"
+                rect_str = button_data.get("Rect", "{{0, 0}, {0, 0}}")
+                try:
+                    # Strip braces in one pass; only x and y are needed
+                    rect_parts = rect_str.translate(_RECT_BRACES).split(",", 2)
+                    # Grid position assumes a standard button size of 100
+                    row = int(float(rect_parts[1])) // 100
+                    col = int(float(rect_parts[0])) // 100
+                except (ValueError, IndexError):
+                    row, col = 0, 0
+
+                if row > max_row:
+                    max_row = row
+                if col > max_col:
+                    max_col = col
+
+                btn = AACButton(
+                    id=button_data.get("ID", ""),
+                    label=text,
+                    type=speak,  # Default to speak
+                    position=(row, col),
+                    style=ButtonStyle(body_color=to_hex(color)),
+                )
+
+                # Check for navigation action
+                for action in button_data.get("Actions", ()):
+                    action_type = action.get("ActionType")
+                    if action_type == "ActionOpenPanel":
+                        btn.type = navigate
+                        target = action.get("ActionParam", {})
+                        btn.target_page_id = target.get("PanelID")
+                    elif action_type == "ActionPressKeyCharSequence":
+                        params = action.get("ActionParam", {})
+                        btn.vocalization = params.get("CharString", text)
+
+                append_button(btn)
 
             # Update grid size
             page.grid_size = (max_row + 1, max_col + 1)
@@ -178,13 +281,17 @@ class ApplePanelsProcessor(FileProcessor):
 
         return tree
 
-    def save_from_tree(self, tree: AACTree, output_path: str) -> None:
+    def save_from_tree(
+        self, tree: AACTree, output_path: str, xml: bool = False
+    ) -> None:
         """Save tree structure as Apple Panels config.
 
         Args:
             tree: Tree structure to save
             output_path: Path to save to (must end with .ascconfig)
+            xml: Write XML plists instead of the smaller, faster binary format
         """
+        plist_fmt = plistlib.FMT_XML if xml else plistlib.FMT_BINARY
         if not output_path.endswith(".ascconfig"):
             output_path += ".ascconfig"
 
@@ -209,11 +316,14 @@ class ApplePanelsProcessor(FileProcessor):
             "NSHumanReadableCopyright": "Generated by AAC Processors",
         }
 
-        with open(contents_dir / "Info.plist", "wb") as f:
-            plistlib.dump(info, f)
+        _write_plist(contents_dir / "Info.plist", info, plist_fmt)
 
         # Create AssetIndex.plist for images
         assets = {}
+        # (url, destination) pairs fetched together once all panels are built
+        downloads: list[tuple[str, Path]] = []
+        # Buttons sharing an image URL share one asset and one download
+        url_to_image_id: dict[str, str] = {}
 
         # Convert pages to panels
         panels = {
@@ -226,25 +336,10 @@ class ApplePanelsProcessor(FileProcessor):
 
         # Convert pages to panels
         for page in tree.pages.values():
-            panel = {
-                "DisplayOrder": 1,
-                "GlidingLensSize": 5,
-                "HasTransientPosition": False,
-                "HideHome": False,
-                "HideMinimize": False,
-                "HidePanelAdjustments": False,
-                "HideSwitchDock": False,
-                "HideSwitchDockContextualButtons": False,
-                "HideTitlebar": False,
-                "ID": page.id,
-                "Name": page.name,
-                "PanelObjects": [],
-                "ProductSupportType": "All",
-                "Rect": "{{15, 75}, {425, 55}}",
-                "ScanStyle": 0,
-                "ShowPanelLocationString": "CustomPanelList",
-                "UsesPinnedResizing": False,
-            }
+            panel = _PANEL_TEMPLATE.copy()
+            panel["ID"] = page.id
+            panel["Name"] = page.name
+            panel["PanelObjects"] = []
 
             # Get page dimensions
             rows, cols = page.grid_size
@@ -254,6 +349,12 @@ class ApplePanelsProcessor(FileProcessor):
             )  # Make height proportional to maintain square buttons
             button_size = min(page_width / cols, page_height / rows)  # Square buttons
 
+            # Per-page invariants: square button size and grid cell offsets
+            size = int(button_size)
+            rect_size = f"{{{size}, {size}}}"
+            col_x = [int(col * button_size) for col in range(cols)]
+            row_y = [int(row * button_size) for row in range(rows)]
+
             # Convert buttons
             for btn in page.buttons:
                 # Use absolute position if available, otherwise calculate from grid
@@ -262,56 +363,39 @@ class ApplePanelsProcessor(FileProcessor):
                     y = int(btn.top * page_height)
                 else:
                     row, col = btn.position
-                    x = int(col * button_size)
-                    y = int(row * button_size)
-
-                # Use square button dimensions
-                width = int(button_size)
-                height = int(button_size)
-
-                button = {
-                    "ButtonType": 0,
-                    "DisplayColor": self._convert_hex_to_apple_color(
-                        btn.style.body_color or "#ffffff"
-                    ),
-                    "DisplayImageResourceIsTemplate": False,
-                    "DisplayImageWeight": "FontWeightRegular",
-                    "DisplayText": btn.label,
-                    "FontSize": 12,
-                    "ID": btn.id,
-                    "PanelObjectType": "Button",
-                    "Rect": f"{{{{{x}, {y}}}, {{{width}, {height}}}}}",
-                }
+                    x = col_x[col] if 0 <= col < cols else int(col * button_size)
+                    y = row_y[row] if 0 <= row < rows else int(row * button_size)
+
+                button = _BUTTON_TEMPLATE.copy()
+                button["DisplayColor"] = self._convert_hex_to_apple_color(
+                    btn.style.body_color or "#ffffff"
+                )
+                button["DisplayText"] = btn.label
+                button["ID"] = btn.id
+                button["Rect"] = f"{{{{{x}, {y}}}, {rect_size}}}"
 
                 # Handle image if present
                 if btn.image and btn.image.get("url"):
-                    import uuid
-
-                    # Generate unique image ID in Apple format
-                    image_id = f"Image.{str(uuid.uuid4()).upper()}"
+                    url = btn.image["url"]
+                    image_id = url_to_image_id.get(url)
+                    if image_id is None:
+                        # Generate unique image ID in Apple format
+                        image_id = f"Image.{str(uuid.uuid4()).upper()}"
+                        url_to_image_id[url] = image_id
+
+                        # Add to assets index with proper format
+                        assets[image_id] = {
+                            "Type": "Image",
+                            "Name": btn.label
+                            or "Button Image",  # Use button label as image name
+                        }
 
-                    # Add to assets index with proper format
-                    assets[image_id] = {
-                        "Type": "Image",
-                        "Name": btn.label
-                        or "Button Image",  # Use button label as image name
-                    }
+                        # Image is saved in Resources with the same ID as referenced
+                        downloads.append((url, resources_dir / image_id))
 
                     # Add image reference to button
                     button["DisplayImageResource"] = image_id
 
-                    # Download and save image directly in Resources
-                    try:
-                        import requests
-
-                        response = requests.get(btn.image["url"])
-                        if response.status_code == 200:
-                            # Save image with the same ID as referenced
-                            with open(resources_dir / image_id, "wb") as f:
-                                f.write(response.content)
-                    except Exception as e:
-                        self.debug(f"Failed to download image {btn.image['url']}: {e}")
-
                 # Add actions
                 if btn.type == ButtonType.NAVIGATE and btn.target_page_id:
                     button["Actions"] = [
@@ -339,13 +423,58 @@ class ApplePanelsProcessor(FileProcessor):
 
             panels["Panels"][page.id] = panel
 
+        if downloads:
+            self._download_images(downloads)
+
         # Save AssetIndex.plist
-        with open(resources_dir / "AssetIndex.plist", "wb") as f:
-            plistlib.dump(assets, f)
+        _write_plist(resources_dir / "AssetIndex.plist", assets, plist_fmt)
 
         # Save panel definitions
-        with open(resources_dir / "PanelDefinitions.plist", "wb") as f:
-            plistlib.dump(panels, f)
+        _write_plist(resources_dir / "PanelDefinitions.plist", panels, plist_fmt)
+
+    def _download_images(self, downloads: list[tuple[str, Path]]) -> None:
+        """Download button images concurrently.
+
+        Failures are reported through debug output and do not abort the save.
+
+        Args:
+            downloads: List of (url, destination path) pairs
+        """
+        try:
+            requests = _get_requests()
+        except ImportError as e:
+            self.debug(f"Failed to download images: {e}")
+            return
+
+        # requests.Session is not thread-safe, so each worker thread gets its
+        # own, reusing connections across the downloads it handles
+        local = threading.local()
+        sessions: list[Any] = []
+
+        def fetch(url: str, dest: Path) -> None:
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+                sessions.append(session)
+            response = session.get(url, timeout=_DOWNLOAD_TIMEOUT)
+            if response.status_code == 200:
+                with open(dest, "wb") as f:
+                    f.write(response.content)
+
+        workers = min(_MAX_DOWNLOAD_WORKERS, len(downloads))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(fetch, url, dest): url for url, dest in downloads
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.debug(f"Failed to download image {futures[future]}: {e}")
+        finally:
+            for session in sessions:
+                session.close()
 
     def _convert_hex_to_apple_color(self, hex_color: str) -> str:
         """Convert hex color to Apple color string format.
@@ -356,13 +485,7 @@ class ApplePanelsProcessor(FileProcessor):
         Returns:
             Color string in format "r g b a" with values 0-1
         """
-        try:
-            # Remove # and convert to RGB
-            rgb = tuple(int(hex_color.lstrip("#")[i : i + 2], 16) for i in (0, 2, 4))
-            # Convert to 0-1 range and add alpha
-            return f"{rgb[0]/255:.3f} {rgb[1]/255:.3f} {rgb[2]/255:.3f} 1.000"
-        except (ValueError, IndexError):
-            return "1.000 1.000 1.000 1.000"  # Default white
+        return _hex_to_apple_color(hex_color)
 
     def extract_texts(self, file_path: str) -> list[str]:
         """Extract all text content from Apple Panels config.
@@ -373,20 +496,88 @@ class ApplePanelsProcessor(FileProcessor):
         Returns:
             List of extracted texts
         """
-        tree = self.load_into_tree(file_path)
+        # Read the parsed plist directly rather than building an AACTree
+        panels = self._load_plist(str(self._get_panels_path(file_path)))
         texts = []
 
-        for page in tree.pages.values():
-            if page.name:
-                texts.append(page.name)
-            for btn in page.buttons:
-                if btn.label:
-                    texts.append(btn.label)
-                if btn.vocalization and btn.vocalization != btn.label:
-                    texts.append(btn.vocalization)
+        for panel in panels.get("Panels", {}).values():
+            name = panel.get("Name", "Untitled Panel")
+            if name:
+                texts.append(name)
+            for obj in panel.get("PanelObjects", ()):
+                if obj.get("PanelObjectType") != "Button":
+                    continue
+                text = obj.get("DisplayText", "")
+                if text:
+                    texts.append(text)
+                # As in load_into_tree, the last key sequence is the vocalization
+                vocalization = None
+                for action in obj.get("Actions", ()):
+                    if action.get("ActionType") == "ActionPressKeyCharSequence":
+                        params = action.get("ActionParam", {})
+                        vocalization = params.get("CharString", text)
+                if vocalization and vocalization != text:
+                    texts.append(vocalization)
 
         return texts
 
+    def _translate_panels(
+        self, panels: dict[str, Any], translations: dict[str, str]
+    ) -> None:
+        """Apply translations directly to parsed panel definitions.
+
+        Args:
+            panels: Parsed PanelDefinitions.plist data, modified in place
+            translations: Dictionary of text translations
+        """
+        tget = translations.get
+        for panel in panels.get("Panels", {}).values():
+            new = tget(panel.get("Name"))
+            if new is not None:
+                panel["Name"] = new
+
+            for obj in panel.get("PanelObjects", []):
+                if obj.get("PanelObjectType") != "Button":
+                    continue
+                new = tget(obj.get("DisplayText"))
+                if new is not None:
+                    obj["DisplayText"] = new
+                for action in obj.get("Actions", []):
+                    if action.get("ActionType") != "ActionPressKeyCharSequence":
+                        continue
+                    params = action.get("ActionParam", {})
+                    new = tget(params.get("CharString"))
+                    if new is not None:
+                        params["CharString"] = new
+
+    def _write_translated_config(
+        self, source_path: str, output_path: str, translations: dict[str, str]
+    ) -> None:
+        """Copy a config and translate its panel definitions in one pass.
+
+        Unlike a load_into_tree/save_from_tree round trip this keeps all
+        panel attributes, images and non-button objects of the source.
+
+        Args:
+            source_path: Path to source .ascconfig folder
+            output_path: Path to translated .ascconfig folder
+            translations: Dictionary of text translations
+        """
+        panels_path = self._get_panels_path(source_path)
+        panels = self._load_plist(str(panels_path))
+        self._translate_panels(panels, translations)
+
+        shutil.copytree(source_path, output_path, dirs_exist_ok=True)
+        # Keep the source's plist format
+        with open(panels_path, "rb") as f:
+            is_binary = f.read(len(BINARY_PLIST_MAGIC)) == BINARY_PLIST_MAGIC
+        relative = panels_path.relative_to(source_path)
+        _write_plist(
+            Path(output_path) / relative,
+            panels,
+            plistlib.FMT_BINARY if is_binary else plistlib.FMT_XML,
+        )
+
     def process_files(
         self, directory: str, translations: Optional[dict[str, str]] = None
     ) -> Optional[str]:
@@ -400,30 +591,16 @@ class ApplePanelsProcessor(FileProcessor):
             Path to translated file if translations applied, None otherwise
         """
         try:
-            # Load tree structure
-            tree = self.load_into_tree(directory)
-
             if translations is None:
                 # Just collect texts
                 self.collected_texts = self.extract_texts(directory)
                 return None
 
-            # Apply translations
-            for page in tree.pages.values():
-                if page.name in translations:
-                    page.name = translations[page.name]
-
-                for btn in page.buttons:
-                    if btn.label in translations:
-                        btn.label = translations[btn.label]
-                    if btn.vocalization in translations:
-                        btn.vocalization = translations[btn.vocalization]
-
             # Save translated version
             target_lang = translations.get("target_lang", "unknown")
             base = os.path.splitext(directory)[0]
             output_path = f"{base}_{target_lang}.ascconfig"
-            self.save_from_tree(tree, output_path)
+            self._write_translated_config(directory, output_path, translations)
 
             return output_path
 
@@ -431,6 +608,26 @@ class ApplePanelsProcessor(FileProcessor):
             self.debug(f"Error processing files: {str(e)}")
             return None
 
+    def write_translated_file(
+        self, file_path: str, translations: dict[str, str], output_path: str
+    ) -> Optional[str]:
+        """Write a translated copy of a config directly to output_path.
+
+        Args:
+            file_path: Path to source .ascconfig folder
+            translations: Dictionary of text translations
+            output_path: Path of the translated .ascconfig folder
+
+        Returns:
+            output_path if successful, None otherwise
+        """
+        try:
+            self._write_translated_config(file_path, output_path, translations)
+            return output_path
+        except Exception as e:
+            self.debug(f"Error creating translated file: {str(e)}")
+            return None
+
     def create_translated_file(
         self, file_path: str, translations: dict[str, str]
     ) -> Optional[str]:
@@ -444,25 +641,11 @@ class ApplePanelsProcessor(FileProcessor):
             Path to translated file if successful, None otherwise
         """
         try:
-            # Load tree structure
-            tree = self.load_into_tree(file_path)
-
-            # Apply translations
-            for page in tree.pages.values():
-                if page.name in translations:
-                    page.name = translations[page.name]
-
-                for btn in page.buttons:
-                    if btn.label in translations:
-                        btn.label = translations[btn.label]
-                    if btn.vocalization in translations:
-                        btn.vocalization = translations[btn.vocalization]
-
             # Save translated version
             target_lang = translations.get("target_lang", "unknown")
             base = os.path.splitext(file_path)[0]
             output_path = f"{base}_{target_lang}.ascconfig"
-            self.save_from_tree(tree, output_path)
+            self._write_translated_config(file_path, output_path, translations)
 
             return output_path
 
@@ -1,31 +1,376 @@
+import errno
 import os
 import shutil
+import struct
 import tempfile
-import uuid
+import threading
+import time
 import zipfile
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Lock
-from typing import Any, Callable, Optional, Union
+from typing import IO, Any, Callable, Optional, Union, cast
 
+from . import _zip_accel
 from .tree_structure import AACTree, ButtonStyle, ButtonType
 
+# Already-compressed formats that deflate cannot shrink; stored as-is in archives
+PRECOMPRESSED_EXTENSIONS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".mp3",
+        ".m4a",
+        ".ogg",
+        ".wav",
+        ".zip",
+    }
+)
+
+# Bytes requested per kernel copy call, and userspace buffer size if we fall
+# back to read/write
+_COPY_RANGE_CHUNK = 1 << 30
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Members larger than this are extracted on worker threads
+PARALLEL_EXTRACT_MIN_SIZE = 64 * 1024
+_EXTRACT_BUFFER_SIZE = 256 * 1024
+
+# Errors meaning a kernel copy primitive is unusable for this pair of files
+_COPY_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+)
+
+# Favour speed over ratio when deflating archive members
+ARCHIVE_COMPRESSLEVEL = 1
+
+# Zip general purpose flags and local file header field indices, as used by
+# zipfile but not exported by it
+_MASK_ENCRYPTED = 0x01
+_MASK_USE_DATA_DESCRIPTOR = 0x08
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+# Header ID of the zip64 extended information extra field
+_EXTRA_ZIP64 = 0x0001
+
+
+def iter_file_entries(root: str) -> Iterator["os.DirEntry[str]"]:
+    """Recursively yield directory entries for all files below a directory.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        DirEntry of each file found, with its stat result cached on first use.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_file_entries(entry.path)
+            else:
+                yield entry
+
+
+def iter_files(root: str) -> Iterator[str]:
+    """Recursively yield the paths of all files below a directory.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Path of each file found.
+    """
+    for entry in iter_file_entries(root):
+        yield entry.path
+
+
+def _member_path(root: str, info: zipfile.ZipInfo) -> str:
+    """Resolve where an archive member is extracted below root.
+
+    Applies the same sanitizing as ZipFile.extract: drive letters, empty,
+    "." and ".." components are dropped so members cannot escape root.
+
+    Args:
+        root: Extraction directory.
+        info: Archive member.
+
+    Returns:
+        Normalized target path.
+    """
+    arcname = info.filename.replace("/", os.sep)
+    if os.altsep:
+        arcname = arcname.replace(os.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid = ("", os.curdir, os.pardir)
+    arcname = os.sep.join(part for part in arcname.split(os.sep) if part not in invalid)
+    return os.path.normpath(os.path.join(root, arcname))
+
+
+def _extract_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, path: str) -> None:
+    """Decompress one archive member to path."""
+    with zip_ref.open(info) as src, open(path, "wb") as dst:
+        # The final size is known, so reserve the blocks before writing
+        if info.file_size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(dst.fileno(), 0, info.file_size)
+            except OSError:
+                pass  # Not supported by this filesystem
+        shutil.copyfileobj(src, dst, _EXTRACT_BUFFER_SIZE)
+        dst.truncate()
+
+
+def _copy_zipinfo(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Copy a member's metadata for writing it to another archive.
+
+    Keeps the name, timestamp, compression method, attributes, extra fields
+    and comment. Zip64 extra records are dropped, since the copy gets new
+    offsets and zipfile adds them again when needed.
+    """
+    member = zipfile.ZipInfo(info.filename, info.date_time)
+    member.compress_type = info.compress_type
+    member.comment = info.comment
+    member.create_system = info.create_system
+    member.create_version = info.create_version
+    member.internal_attr = info.internal_attr
+    member.external_attr = info.external_attr
+    member.flag_bits = info.flag_bits & ~_MASK_USE_DATA_DESCRIPTOR
+    member.file_size = info.file_size
+
+    extra = info.extra
+    kept = []
+    while len(extra) >= 4:
+        header_id, size = struct.unpack("<HH", extra[:4])
+        if header_id != _EXTRA_ZIP64:
+            kept.append(extra[: 4 + size])
+        extra = extra[4 + size :]
+    member.extra = b"".join(kept)
+    return member
+
+
+def _supports_raw_copy(source: zipfile.ZipFile, target: zipfile.ZipFile) -> bool:
+    """Check zipfile has the internals a raw member copy relies on.
+
+    These are undocumented attributes of CPython's zipfile, present from
+    3.6 onwards. Targets that are not seekable are refused as well.
+    """
+    return (
+        all(
+            hasattr(target, name)
+            for name in ("_writecheck", "_didModify", "_seekable", "start_dir")
+        )
+        and target._seekable  # type: ignore[attr-defined]
+        and source.fp is not None
+        and target.fp is not None
+        and hasattr(zipfile, "structFileHeader")
+        and hasattr(zipfile, "sizeFileHeader")
+        and hasattr(zipfile, "stringFileHeader")
+    )
+
+
+def _copy_raw_member(
+    source: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    target: zipfile.ZipFile,
+    member: zipfile.ZipInfo,
+) -> None:
+    """Copy an archive member's compressed data without decompressing it.
+
+    A new local header is written with the CRC and sizes from the central
+    directory, so members that used a trailing data descriptor are copied
+    too.
+
+    Args:
+        source: Archive open for reading
+        info: Member of source to copy
+        target: Seekable archive open for writing
+        member: Metadata to write the member with
+    """
+    fp = cast(IO[bytes], source.fp)
+    fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad magic number for file header: {info.filename}")
+    fp.seek(header[_FH_FILENAME_LENGTH] + header[_FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+    member.CRC = info.CRC
+    member.compress_size = info.compress_size
+    target._writecheck(member)  # type: ignore[attr-defined]
+    out = cast(IO[bytes], target.fp)
+    out.seek(target.start_dir)  # type: ignore[attr-defined]
+    member.header_offset = out.tell()
+    out.write(member.FileHeader(False))
+    remaining = info.compress_size
+    while remaining:
+        chunk = fp.read(min(remaining, _COPY_BUFFER_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member: {info.filename}")
+        out.write(chunk)
+        remaining -= len(chunk)
+
+    target.start_dir = out.tell()  # type: ignore[attr-defined]
+    target.filelist.append(member)
+    target.NameToInfo[member.filename] = member
+    target._didModify = True  # type: ignore[attr-defined]
+
+
+def copy_archive_member(
+    source: zipfile.ZipFile, info: zipfile.ZipInfo, target: zipfile.ZipFile
+) -> None:
+    """Copy a member from one archive into another.
+
+    The compressed data is copied as it is where possible, so the member
+    keeps its compression method, CRC and exact bytes. Encrypted and zip64
+    members, or a zipfile without the internals this relies on, fall back to
+    streaming the member through ZipFile.open, compressed with its original
+    method at the target archive's level. Either way the member keeps its
+    metadata.
+
+    Args:
+        source: Archive open for reading
+        info: Member of source to copy
+        target: Archive open for writing
+    """
+    member = _copy_zipinfo(info)
+    if (
+        not info.flag_bits & _MASK_ENCRYPTED
+        and info.compress_size < zipfile.ZIP64_LIMIT
+        and info.file_size < zipfile.ZIP64_LIMIT
+        and _supports_raw_copy(source, target)
+    ):
+        _copy_raw_member(source, info, target, member)
+        return
+
+    member.flag_bits = 0
+    # Picked up by ZipFile.open, which ignores the archive's level
+    member._compresslevel = target.compresslevel  # type: ignore[attr-defined]
+    with source.open(info) as src, target.open(member, "w") as dst:
+        shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+
+def set_member_compression(info: zipfile.ZipInfo, zip_ref: zipfile.ZipFile) -> None:
+    """Pick how a new member is compressed.
+
+    Empty members and already-compressed media are stored, since deflating
+    them gains next to nothing. Everything else uses the archive's
+    compression and level.
+
+    Args:
+        info: Member about to be written, with its file_size set
+        zip_ref: Archive the member is written to
+    """
+    ext = os.path.splitext(info.filename)[1].lower()
+    if not info.file_size or ext in PRECOMPRESSED_EXTENSIONS:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zip_ref.compression
+        # Picked up by ZipFile.open, which ignores the archive's level
+        info._compresslevel = zip_ref.compresslevel  # type: ignore[attr-defined]
+
+
+def write_archive_data(
+    zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes
+) -> None:
+    """Add an in-memory member to an archive.
+
+    Compression is picked by set_member_compression.
+
+    Args:
+        zip_ref: Archive being written
+        info: Name and metadata of the member
+        data: Contents of the member
+    """
+    info.file_size = len(data)
+    set_member_compression(info, zip_ref)
+    zip_ref.writestr(info, data)
+
+
+def iter_archive_entries(root: str) -> Iterator[tuple["os.DirEntry[str]", str]]:
+    """Yield files below a directory paired with their archive names.
+
+    Archive names are sliced off the entry path instead of computed with
+    os.path.relpath for every file.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Tuple of (directory entry, path relative to root).
+    """
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    for entry in iter_file_entries(root):
+        yield entry, entry.path[prefix_len:]
+
+
+def _zipinfo_from_stat(arc_name: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """Build archive member metadata from an existing stat result.
+
+    Mirrors ZipInfo.from_file without stat-ing the file again.
+
+    Args:
+        arc_name: Name of the member in the archive.
+        st: Stat result of the file on disk.
+
+    Returns:
+        Member metadata for a regular file.
+    """
+    date_time = time.localtime(st.st_mtime)[:6]
+    # The zip format cannot represent timestamps outside 1980-2107
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+    info = zipfile.ZipInfo(arc_name, date_time)
+    info.external_attr = (st.st_mode & 0xFFFF) << 16
+    info.file_size = st.st_size
+    return info
+
 
 class AACProcessor(ABC):
-    """Base class for AAC file processors."""
+    """Base class for AAC file processors.
+
+    Processors can be used as context managers to remove their session
+    workspace on exit::
 
-    _temp_lock = Lock()  # Class-level lock for temp operations
+        with SomeProcessor() as processor:
+            processor.process_texts(path)
+    """
 
     def __init__(self) -> None:
         """Initialize the processor."""
         self.tree = AACTree()
-        self._session_id = str(uuid.uuid4())
         self.source_file: Optional[Path] = None
         self.temp_dir: Optional[Path] = None
+        # str(self.temp_dir), kept alongside it so callers get the same object
+        self._temp_dir_str: Optional[str] = None
+        self._workspace_lock = threading.Lock()
         self._original_filename: Optional[str] = None
         self._debug_output: Optional[Callable[[str], None]] = None
+        # Looked up once rather than for every debug message
+        self._class_name = type(self).__name__
         self.is_archive = False  # Default to non-archive
         self.collected_texts: list[str] = []
+        # Archive the workspace was extracted from, and (size, mtime) of each
+        # extracted member, used to pass unchanged members straight through
+        self._source_archive: Optional[str] = None
+        self._extracted_stats: dict[str, tuple[int, int]] = {}
+        # Workspace files a processor reports rewriting, see _mark_modified
+        self._modified_paths: set[str] = set()
+
+    def __enter__(self) -> "AACProcessor":
+        """Enter a processing session.
+
+        Returns:
+            The processor itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Clean up the session workspace when leaving the session."""
+        self.cleanup_temp_files()
 
     def get_session_workspace(self) -> str:
         """Get a unique workspace directory for this processing session.
@@ -36,17 +381,25 @@ class AACProcessor(ABC):
         Raises:
             RuntimeError: If workspace creation fails.
         """
-        if not self.temp_dir:
-            with self._temp_lock:
-                temp_dir = tempfile.mkdtemp(prefix=f"aac_{self._session_id}_")
-                if not temp_dir:
-                    raise RuntimeError("Failed to create temporary directory")
-                self.temp_dir = Path(temp_dir)
-                self._debug_print(f"Created session workspace: {temp_dir}")
-
-        if not self.temp_dir:  # For type checker
-            raise RuntimeError("Temporary directory not available")
-        return str(self.temp_dir)
+        td = self._temp_dir_str
+        if td is not None:
+            return td
+
+        # Per-instance lock: threads sharing this processor must agree on one
+        # workspace, other processors create theirs without waiting
+        with self._workspace_lock:
+            td = self._temp_dir_str
+            if td is not None:
+                return td
+
+            # The random suffix mkdtemp adds already makes the name unique
+            temp_dir = tempfile.mkdtemp(prefix="aac_")
+            if not temp_dir:
+                raise RuntimeError("Failed to create temporary directory")
+            self.temp_dir = Path(temp_dir)
+            self._temp_dir_str = temp_dir
+        self._debug_print(f"Created session workspace: {temp_dir}")
+        return temp_dir
 
     def set_source_file(self, file_path: str) -> None:
         """Record the original filename.
@@ -54,10 +407,10 @@ class AACProcessor(ABC):
         Args:
             file_path: Path to the source file.
         """
-        filename = os.path.splitext(os.path.basename(file_path))[0]
-        self._original_filename = filename
+        # Parse the path once and take the name from it
         self.source_file = Path(file_path)
-        self._debug_print(f"Set source file: {filename}")
+        self._original_filename = self.source_file.stem
+        self._debug_print(f"Set source file: {self._original_filename}")
 
     def _prepare_workspace(self, file_path: str) -> str:
         """Prepare workspace based on file type.
@@ -70,16 +423,111 @@ class AACProcessor(ABC):
         """
         workspace = self.get_session_workspace()
 
-        if self.is_archive and zipfile.is_zipfile(file_path):
+        # Opening the archive reads its central directory once; a separate
+        # is_zipfile() probe would scan for it a second time
+        zip_ref = self._open_archive(file_path) if self.is_archive else None
+        if zip_ref is not None:
             self._debug_print(f"Extracting archive to workspace: {workspace}")
-            with zipfile.ZipFile(file_path, "r") as zip_ref:
-                zip_ref.extractall(workspace)
+            with zip_ref:
+                self._extract_archive(zip_ref, file_path, workspace)
         else:
             self._debug_print(f"Copying file to workspace: {workspace}")
-            shutil.copy2(file_path, workspace)
+            # Scratch copy: contents only, no metadata syscalls
+            dest = os.path.join(workspace, os.path.basename(file_path))
+            self._fastcopy(file_path, dest)
+            self._source_archive = None
+            self._extracted_stats = {}
 
+        self._modified_paths = set()
         return workspace
 
+    def _mark_modified(self, path: str) -> None:
+        """Record that a file in the workspace was rewritten.
+
+        Processors call this after editing a prepared file, so the file is
+        taken from disk when the output archive is built. Size and mtime
+        checks catch most edits too, but not on filesystems with coarse
+        timestamps.
+
+        Args:
+            path: Path of the edited file
+        """
+        self._modified_paths.add(os.path.abspath(path))
+
+    @staticmethod
+    def _open_archive(file_path: str) -> Optional[zipfile.ZipFile]:
+        """Open a file as a zip archive.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            The open archive, or None if the file is not a zip archive.
+        """
+        try:
+            return _zip_accel.ZipFile(file_path, "r")
+        except zipfile.BadZipFile:
+            return None
+
+    def _extract_archive(
+        self, zip_ref: zipfile.ZipFile, file_path: str, workspace: str
+    ) -> None:
+        """Extract an archive into the workspace.
+
+        Small members are extracted on the calling thread. Larger ones are
+        spread over a thread pool, each thread with its own ZipFile handle,
+        since zlib releases the GIL while decompressing.
+
+        Args:
+            zip_ref: The archive, already open for reading
+            file_path: Path to the archive
+            workspace: Directory to extract into
+        """
+        self._source_archive = os.path.abspath(file_path)
+        self._extracted_stats = {}
+        large: list[tuple[zipfile.ZipInfo, str]] = []
+
+        members = [(info, _member_path(workspace, info)) for info in zip_ref.infolist()]
+        # Create every target directory once up front
+        directories = {
+            path if info.is_dir() else os.path.dirname(path) for info, path in members
+        }
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+
+        files = [(i, p) for i, p in members if not i.is_dir() and p != workspace]
+        for info, path in files:
+            if info.file_size > PARALLEL_EXTRACT_MIN_SIZE:
+                large.append((info, path))
+            else:
+                _extract_member(zip_ref, info, path)
+
+        if len(large) == 1:
+            _extract_member(zip_ref, *large[0])
+
+        if len(large) > 1:
+            local = threading.local()
+            handles: list[zipfile.ZipFile] = []
+
+            def extract(member: tuple[zipfile.ZipInfo, str]) -> None:
+                handle = getattr(local, "zip_ref", None)
+                if handle is None:
+                    handle = local.zip_ref = _zip_accel.ZipFile(file_path, "r")
+                    handles.append(handle)
+                _extract_member(handle, *member)
+
+            workers = min(os.cpu_count() or 1, len(large))
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(extract, large))
+            finally:
+                for handle in handles:
+                    handle.close()
+
+        for info, path in files:
+            st = os.stat(path)
+            self._extracted_stats[info.filename] = (st.st_size, st.st_mtime_ns)
+
     def _create_output(self, workspace: str, output_path: str) -> None:
         """Create final output file from workspace.
 
@@ -89,19 +537,174 @@ class AACProcessor(ABC):
         """
         if self.is_archive:
             self._debug_print(f"Creating archive at: {output_path}")
-            with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-                for root, _, files in os.walk(workspace):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arc_name = os.path.relpath(file_path, workspace)
-                        zip_ref.write(file_path, arc_name)
+            output_abspath = os.path.abspath(output_path)
+            with open(output_path, "wb", buffering=_COPY_BUFFER_SIZE) as out:
+                with _zip_accel.ZipFile(
+                    out,
+                    "w",
+                    zipfile.ZIP_DEFLATED,
+                    compresslevel=ARCHIVE_COMPRESSLEVEL,
+                ) as zip_ref:
+                    written = self._copy_unchanged_members(workspace, zip_ref)
+                    for entry, arc_name in iter_archive_entries(workspace):
+                        arc_name = arc_name.replace(os.sep, "/")
+                        file_path = os.fspath(entry)
+                        if arc_name in written or file_path == output_abspath:
+                            continue
+                        self._write_archive_member(
+                            zip_ref, file_path, arc_name, entry.stat()
+                        )
         else:
             self._debug_print(f"Copying output file to: {output_path}")
             # For non-archives, find and copy the processed file
             processed_files = os.listdir(workspace)
             if processed_files:
                 source = os.path.join(workspace, processed_files[0])
-                shutil.copy2(source, output_path)
+                self._fastcopy(source, output_path)
+
+    def _copy_unchanged_members(
+        self, workspace: str, zip_ref: zipfile.ZipFile
+    ) -> set[str]:
+        """Pass members the processor did not touch through from the source.
+
+        Members not marked with _mark_modified whose extracted copy still has
+        its recorded size and mtime are copied from the source archive
+        with copy_archive_member, so they keep their exact compressed bytes.
+
+        Args:
+            workspace: Path to the working directory
+            zip_ref: Archive being written
+
+        Returns:
+            Names of the members that were copied.
+        """
+        written: set[str] = set()
+        if not self._source_archive or not os.path.exists(self._source_archive):
+            return written
+
+        with _zip_accel.ZipFile(self._source_archive, "r") as source:
+            for info in source.infolist():
+                extracted = self._extracted_stats.get(info.filename)
+                if extracted is None:
+                    continue
+                path = _member_path(workspace, info)
+                if path in self._modified_paths:
+                    continue  # Reported as edited, written from disk instead
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # Removed by the processor
+                if (st.st_size, st.st_mtime_ns) != extracted:
+                    continue  # Modified, written from disk instead
+
+                copy_archive_member(source, info, zip_ref)
+                written.add(info.filename)
+
+        return written
+
+    def _write_archive_member(
+        self,
+        zip_ref: zipfile.ZipFile,
+        file_path: str,
+        arc_name: str,
+        st: Optional[os.stat_result] = None,
+    ) -> None:
+        """Add a workspace file to an archive.
+
+        Compression is picked by set_member_compression.
+
+        Args:
+            zip_ref: Archive being written
+            file_path: Path of the file on disk
+            arc_name: Name of the member in the archive
+            st: Stat result of the file if already known
+        """
+        info = _zipinfo_from_stat(arc_name, st or os.stat(file_path))
+        set_member_compression(info, zip_ref)
+        if info.file_size == 0:
+            # Nothing to compress or read
+            zip_ref.writestr(info, b"")
+            return
+
+        with open(file_path, "rb") as src, zip_ref.open(info, "w") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+    def _fastcopy(self, src: str, dst: str) -> None:
+        """Copy file contents, preferring in-kernel copy primitives.
+
+        Tries os.copy_file_range, then os.sendfile, then a buffered
+        read/write loop. Each fallback resumes from the current file offsets,
+        so a primitive failing part-way through is harmless. A primitive that
+        copies nothing on its first call is also passed over rather than
+        taken as end of file: procfs, sysfs and some FUSE filesystems report
+        a size of 0 and return 0 without copying. Only the modification time
+        is carried over, not the full copystat.
+
+        Args:
+            src: Source file path
+            dst: Destination file path
+        """
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            copied = False
+
+            if hasattr(os, "copy_file_range"):
+                try:
+                    if os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_CHUNK):
+                        while os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_CHUNK):
+                            pass
+                        copied = True
+                except OSError as e:
+                    if e.errno not in _COPY_UNSUPPORTED_ERRNOS:
+                        raise
+
+            if not copied and hasattr(os, "sendfile"):
+                try:
+                    if os.sendfile(dst_fd, src_fd, None, _COPY_BUFFER_SIZE):
+                        while os.sendfile(dst_fd, src_fd, None, _COPY_BUFFER_SIZE):
+                            pass
+                        copied = True
+                except OSError as e:
+                    if e.errno not in _COPY_UNSUPPORTED_ERRNOS:
+                        raise
+
+            if not copied:
+                buffer = memoryview(bytearray(_COPY_BUFFER_SIZE))
+                while True:
+                    read = fsrc.readinto(buffer)
+                    if not read:
+                        break
+                    fdst.write(buffer[:read])
+
+        self._copy_mtime(src, dst)
+
+    def _deliver_result(self, result: str, output_path: str) -> None:
+        """Put a translated file at the requested output path.
+
+        Results inside the session workspace are disposable, so they are
+        renamed into place when possible. Anything else, such as a processor
+        returning its input path, is copied.
+
+        Args:
+            result: Path returned by create_translated_file
+            output_path: Path the caller asked for
+        """
+        workspace = self._temp_dir_str
+        if workspace and os.path.abspath(result).startswith(workspace + os.sep):
+            try:
+                os.replace(result, output_path)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+        self._fastcopy(result, output_path)
+
+    @staticmethod
+    def _copy_mtime(src: str, dst: str) -> None:
+        """Give dst the access and modification times of src."""
+        stat = os.stat(src)
+        os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
 
     def get_output_path(self, target_lang: Optional[str] = None) -> str:
         """Generate output path using original filename.
@@ -120,20 +723,22 @@ class AACProcessor(ABC):
 
         # Use original filename but in session workspace
         output_name = f"{self._original_filename}_{target_lang or 'translated'}"
-        workspace = (
-            self.get_session_workspace()
-        )  # This ensures we have a valid workspace
-        return os.path.join(workspace, output_name)
+        # Creates the workspace on first use
+        workspace = self._temp_dir_str or self.get_session_workspace()
+        return f"{workspace}{os.sep}{output_name}"
 
     def cleanup_temp_files(self) -> None:
         """Clean up temporary files and directories."""
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-                self.temp_dir = None
-                self._debug_print("Cleaned up workspace directory")
-            except Exception as e:
-                self._debug_print(f"Error cleaning workspace: {str(e)}")
+        if self.temp_dir:
+            # A workspace that is already gone is not an error, so skip the
+            # exists() check and let rmtree ignore it
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+            self._temp_dir_str = None
+            self._source_archive = None
+            self._extracted_stats = {}
+            self._modified_paths = set()
+            self._debug_print("Cleaned up workspace directory")
 
     def _debug_print(self, message: str) -> None:
         """Print debug message using configured output function.
@@ -141,8 +746,9 @@ class AACProcessor(ABC):
         Args:
             message (str): Debug message to print.
         """
-        if self._debug_output:
-            self._debug_output(f"DEBUG:{self.__class__.__name__}: {message}")
+        output = self._debug_output
+        if output is not None:
+            output(f"DEBUG:{self._class_name}: {message}")
 
     def set_debug_output(self, debug_output: Optional[Callable[[str], None]]) -> None:
         """Set debug output callback.
@@ -158,8 +764,9 @@ class AACProcessor(ABC):
         Args:
             message: Message to output.
         """
-        if self._debug_output:
-            self._debug_output(f"{self.__class__.__name__}: {message}")
+        output = self._debug_output
+        if output is not None:
+            output(f"{self._class_name}: {message}")
 
     @abstractmethod
     def can_process(self, file_path: str) -> bool:
@@ -219,6 +826,20 @@ class AACProcessor(ABC):
         """
         pass
 
+    def extract_texts_raw(self, file_path: str) -> Iterator[str]:
+        """Stream translatable texts without building an AACTree.
+
+        Processors that can read texts straight from their file format
+        override this; the default falls back to extract_texts.
+
+        Args:
+            file_path: Path to file to extract texts from.
+
+        Yields:
+            Each translatable text.
+        """
+        yield from cast(list[str], self.extract_texts(file_path))
+
     @abstractmethod
     def create_translated_file(
         self, file_path: str, translations: dict[str, str]
@@ -234,6 +855,29 @@ class AACProcessor(ABC):
         """
         pass
 
+    def write_translated_file(
+        self, file_path: str, translations: dict[str, str], output_path: str
+    ) -> Optional[str]:
+        """Write a translated version of a file to a given path.
+
+        The default creates the translated file with create_translated_file
+        and then moves or copies it to output_path. Processors that can
+        serialize straight to the target override this to skip that step.
+
+        Args:
+            file_path: Path to original file.
+            translations: Dictionary of translations.
+            output_path: Path where the translated file should be written.
+
+        Returns:
+            output_path if successful, None otherwise.
+        """
+        result = self.create_translated_file(file_path, translations)
+        if not result:
+            return None
+        self._deliver_result(result, output_path)
+        return output_path
+
     def process_texts(
         self,
         file_path: str,
@@ -262,20 +906,16 @@ class AACProcessor(ABC):
             self.collected_texts = []
 
             if translations is None:
-                # Extract texts
-                texts = self.extract_texts(file_path, include_context)
-                return texts
+                if not include_context:
+                    # Plain texts do not need the tree round-trip
+                    return list(self.extract_texts_raw(file_path))
+                return self.extract_texts(file_path, include_context)
 
-            # Create translated file
-            result = self.create_translated_file(file_path, translations)
-            if result:
-                if output_path:
-                    # Copy result to output path if specified
-                    shutil.copy2(result, output_path)
-                    return output_path
-                return result
+            if output_path:
+                return self.write_translated_file(file_path, translations, output_path)
 
-            return None
+            # Create translated file
+            return self.create_translated_file(file_path, translations) or None
 
         except Exception as e:
             self.debug(f"Error processing texts: {str(e)}")
@@ -285,6 +925,20 @@ class AACProcessor(ABC):
 class AACButton:
     """Button in an AAC system."""
 
+    __slots__ = (
+        "id",
+        "label",
+        "type",
+        "position",
+        "target_page_id",
+        "vocalization",
+        "action",
+        "image",
+        "style",
+        "width",
+        "height",
+    )
+
     def __init__(
         self,
         id: str,
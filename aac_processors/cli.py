@@ -1,34 +1,28 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
+import importlib
 import os
 import readline
 import sys
-from typing import Optional, Union
-
-from .coughdrop_processor import CoughDropProcessor
-from .dot_processor import DotProcessor
-from .gridset_processor import GridsetProcessor
-from .opml_processor import OPMLProcessor
-from .snap_processor import SnapProcessor
-from .touchchat_processor import TouchChatProcessor
+from typing import TYPE_CHECKING, Optional
+
 from .tree_structure import AACTree
 from .viewer import get_processor_for_file, print_tree
 
-# Type alias for processors
-ProcessorType = Union[
-    GridsetProcessor,
-    TouchChatProcessor,
-    SnapProcessor,
-    CoughDropProcessor,
-    OPMLProcessor,
-    DotProcessor,
-]
+if TYPE_CHECKING:
+    from .base_processor import AACProcessor
+
+
+# Matches for the last completed text. Readline calls the completer once per
+# candidate (state 0, 1, ...) so the directory is only scanned for state 0.
+_completion_cache: Optional[tuple[tuple[str, str], list[str]]] = None
 
 
 def complete_path(text: str, state: int) -> Optional[str]:
     """Tab completion function for file paths"""
+    global _completion_cache
+
     if "~" in text:
         text = os.path.expanduser(text)
 
@@ -36,29 +30,52 @@ def complete_path(text: str, state: int) -> Optional[str]:
     if os.path.isdir(text):
         return text + "/" if not text.endswith("/") else text
 
-    dir_name = os.path.dirname(text)
-    if dir_name and not os.path.exists(dir_name):
-        return None
-
-    # Get pattern for matching
-    if dir_name:
-        pattern = os.path.join(dir_name, os.path.basename(text) + "*")
+    dir_name, basename = os.path.split(text)
+    key = (dir_name, basename)
+    if state > 0 and _completion_cache and _completion_cache[0] == key:
+        matches = _completion_cache[1]
     else:
-        pattern = text + "*"
-
-    # Get matches and sort them (directories first)
-    matches = glob.glob(pattern)
-    matches = sorted(
-        [f"{m}{'/' if os.path.isdir(m) else ''}" for m in matches],
-        key=lambda x: (not x.endswith("/"), x),  # Sort directories first
-    )
+        matches = []
+        try:
+            with os.scandir(dir_name or ".") as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith(basename):
+                        continue
+                    # Like glob, hidden entries only match an explicit "."
+                    if name.startswith(".") and not basename.startswith("."):
+                        continue
+                    path = os.path.join(dir_name, name) if dir_name else name
+                    matches.append(path + "/" if entry.is_dir() else path)
+        except OSError:
+            return None
+        # Sort directories first
+        matches.sort(key=lambda x: (not x.endswith("/"), x))
+        _completion_cache = (key, matches)
 
     return matches[state] if state < len(matches) else None
 
 
+# Output format name -> (module, class) of its processor. Modules are only
+# imported once a format is used, so the CLI starts without loading them all.
+_FORMAT_REGISTRY: dict[str, tuple[str, str]] = {
+    "grid": (".gridset_processor", "GridsetProcessor"),
+    "touchchat": (".touchchat_processor", "TouchChatProcessor"),
+    "snap": (".snap_processor", "SnapProcessor"),
+    "coughdrop": (".coughdrop_processor", "CoughDropProcessor"),
+    "opml": (".opml_processor", "OPMLProcessor"),
+    "dot": (".dot_processor", "DotProcessor"),
+}
+
+
+def _load_processor_class(module: str, name: str) -> "type[AACProcessor]":
+    """Import a processor class from a module of this package."""
+    return getattr(importlib.import_module(module, __package__), name)
+
+
 def get_available_formats() -> list[str]:
     """Get list of available format names"""
-    return ["grid", "touchchat", "snap", "coughdrop", "opml", "dot"]
+    return list(_FORMAT_REGISTRY)
 
 
 def convert_format(
@@ -91,19 +108,10 @@ def convert_format(
         print(f"Loaded tree with {len(tree.pages)} pages")
 
         # Get target processor based on format
-        target_processor: Optional[ProcessorType] = None
-        if output_format == "grid":
-            target_processor = GridsetProcessor()
-        elif output_format == "touchchat":
-            target_processor = TouchChatProcessor()
-        elif output_format == "snap":
-            target_processor = SnapProcessor()
-        elif output_format == "coughdrop":
-            target_processor = CoughDropProcessor()
-        elif output_format == "opml":
-            target_processor = OPMLProcessor()
-        elif output_format == "dot":
-            target_processor = DotProcessor()
+        target_processor: Optional[AACProcessor] = None
+        entry = _FORMAT_REGISTRY.get(output_format)
+        if entry:
+            target_processor = _load_processor_class(*entry)()
 
         if not target_processor:
             print(f"Error: Unsupported output format: {output_format}")
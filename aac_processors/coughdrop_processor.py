@@ -1,24 +1,57 @@
-import json
+import base64
+import copy
+import hashlib
 import os
+import posixpath
 import shutil
-import tempfile
+import threading
+import time
 import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Union
 
+from . import _fast_json, _zip_accel
+from .base_processor import (
+    ARCHIVE_COMPRESSLEVEL,
+    PARALLEL_EXTRACT_MIN_SIZE,
+    copy_archive_member,
+    iter_archive_entries,
+    write_archive_data,
+)
 from .file_processor import FileProcessor
 from .tree_structure import AACButton, AACPage, AACSymbol, AACTree, ButtonType
 
 
+class _MissingManifestError(ValueError):
+    """An OBZ archive has no manifest.json, so it lists no boards."""
+
+
 class CoughDropProcessor(FileProcessor):
     """Processor for CoughDrop OBZ/OBF files."""
 
-    def __init__(self) -> None:
-        """Initialize CoughDrop processor."""
+    def __init__(self, obz_compression: int = zipfile.ZIP_DEFLATED) -> None:
+        """Initialize CoughDrop processor.
+
+        Args:
+            obz_compression: zipfile compression used for boards in written
+                OBZ files. ZIP_STORED skips compressing small JSON boards.
+        """
         super().__init__()
+        self.obz_compression = obz_compression
         self.collected_texts: list[str] = []
         self.file_path: Optional[str] = None
         self.original_filename: Optional[str] = None
         self.original_file_path: Optional[str] = None
+        # Trees parsed during one process_texts/process_files call, keyed by
+        # (path, mtime_ns, size)
+        self._tree_cache: dict[tuple[str, int, int], AACTree] = {}
+        # Parsed boards of the last OBF/OBZ file read, keyed by
+        # (absolute path, mtime_ns, size), so translating one file into
+        # several languages parses it once
+        self._board_cache: dict[
+            tuple[str, int, int], list[tuple[str, dict[str, Any]]]
+        ] = {}
 
     def can_process(self, file_path: str) -> bool:
         """Check if file can be processed.
@@ -40,17 +73,25 @@ class CoughDropProcessor(FileProcessor):
         """
         self.save_from_tree(tree, output_path)
 
-    def _load_board_into_tree(self, file_path: str, tree: AACTree) -> None:
+    def _load_board_into_tree(
+        self,
+        file_path: str,
+        tree: AACTree,
+        board_data: Optional[dict[str, Any]] = None,
+    ) -> None:
         """Load board data into tree structure.
 
         Args:
             file_path: Path to the OBF file to load
             tree: Tree to add the board to
+            board_data: Already parsed board, in which case file_path is
+                only used in error messages
         """
         try:
             # Load and parse the JSON file first
-            with open(file_path, encoding="utf-8") as f:
-                board_data = json.load(f)
+            if board_data is None:
+                with open(file_path, "rb") as f:
+                    board_data = _fast_json.load(f)
 
             # Get grid dimensions
             grid = board_data.get("grid", {})
@@ -58,9 +99,6 @@ class CoughDropProcessor(FileProcessor):
             cols = grid.get("columns", 1)
 
             # Create page
-            # Map OBF image id to loaded image dict for faster lookup
-            images_map = {img.get("id"): img for img in board_data.get("images", []) if img.get("id")}
-
             page = AACPage(
                 id=board_data.get("id", ""),
                 name=board_data.get("name", ""),
@@ -68,6 +106,21 @@ class CoughDropProcessor(FileProcessor):
                 parent_id=None,  # Will be set when processing navigation buttons
             )
 
+            # Map button id to its (row, column) in the grid order, keeping
+            # the first cell when an id appears more than once
+            positions: dict[Any, tuple[int, int]] = {}
+            for y, row in enumerate(grid.get("order", [])):
+                for x, cell in enumerate(row):
+                    if cell is not None:
+                        positions.setdefault(cell, (y, x))
+
+            # Provide default grid-based sizes if button width/height missing
+            default_width = 1.0 / cols if cols > 0 else 1.0
+            default_height = 1.0 / rows if rows > 0 else 1.0
+            tree_pages = tree.pages
+            # Map OBF image id to loaded image dict, built on first image use
+            images_map: Optional[dict[Any, dict[str, Any]]] = None
+
             # Process buttons
             buttons = board_data.get("buttons", [])
             for button in buttons:
@@ -80,29 +133,30 @@ class CoughDropProcessor(FileProcessor):
                     button_type = ButtonType.NAVIGATE
                     target_page_id = button["load_board"].get("id", "")
                     # Set parent_id for the target page if it exists
-                    if target_page_id and target_page_id in tree.pages:
-                        tree.pages[target_page_id].parent_id = page.id
+                    if target_page_id:
+                        target_page = tree_pages.get(target_page_id)
+                        if target_page is not None:
+                            target_page.parent_id = page.id
                 elif "action" in button:
                     button_type = ButtonType.ACTION
-                    action = button["action"]
+                    # The board may be shared through _board_cache, so the
+                    # tree gets its own copy of a structured action
+                    action = copy.deepcopy(button["action"])
 
                 # Get position from grid order
-                pos_x = 0
-                pos_y = 0
-                if "grid" in board_data:
-                    order = grid.get("order", [])
-                    for i, row in enumerate(order):
-                        if button["id"] in row:
-                            pos_y = i
-                            pos_x = row.index(button["id"])
-                            break  # Found position, exit inner loop
+                pos_y, pos_x = positions.get(button.get("id"), (0, 0))
 
                 # Get image data if present
                 symbol: Optional[AACSymbol] = None
                 if "image_id" in button:
-                    image_id = button["image_id"]
-                    if image_id in images_map:
-                        img_data = images_map[image_id]
+                    if images_map is None:
+                        images_map = {
+                            img_id: img
+                            for img in board_data.get("images", ())
+                            if (img_id := img.get("id"))
+                        }
+                    img_data = images_map.get(button["image_id"])
+                    if img_data is not None:
                         internal_id = img_data.get("id")
                         data_url = img_data.get("data")
                         url = img_data.get("url")
@@ -124,9 +178,6 @@ class CoughDropProcessor(FileProcessor):
                             self.debug(f"Image {internal_id} has no parsable data, url, or symbol info.")
 
                 # Get dimensions - these are percentages in OBF format
-                # Provide default grid-based sizes if width/height missing
-                default_width = 1.0 / cols if cols > 0 else 1.0
-                default_height = 1.0 / rows if rows > 0 else 1.0
                 width = button.get("width", default_width)
                 height = button.get("height", default_height)
                 left = button.get("left")  # Optional absolute position
@@ -161,6 +212,270 @@ class CoughDropProcessor(FileProcessor):
             self.debug(f"Error loading board file {file_path}: {str(e)}")
             raise
 
+    def _load_tree_cached(self, file_path: str) -> AACTree:
+        """Load a board file, reusing a tree already parsed from it.
+
+        A board rewritten since it was parsed has a new modification time or
+        size and is loaded again.
+
+        Args:
+            file_path: Path to the OBF file to load.
+
+        Returns:
+            AACTree: Tree for the board.
+        """
+        st = os.stat(file_path)
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        tree = self._tree_cache.get(key)
+        if tree is None:
+            tree = self._tree_cache[key] = self.load_into_tree(file_path)
+        return tree
+
+    def _load_boards_cached(self, file_path: str) -> list[tuple[str, dict[str, Any]]]:
+        """Parse the boards of an OBF or OBZ file, reusing an earlier parse.
+
+        Only the most recently read file is kept. A file rewritten since it
+        was parsed has a new modification time or size and is read again.
+        The returned boards are shared and must not be modified.
+
+        Args:
+            file_path: Path to the OBF or OBZ file.
+
+        Returns:
+            List of (board path, parsed board) tuples in manifest order.
+        """
+        st = os.stat(file_path)
+        key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        boards = self._board_cache.get(key)
+        if boards is None:
+            if file_path.endswith(".obz"):
+                boards = list(self._iter_obz_boards(file_path))
+            else:
+                with open(file_path, "rb") as f:
+                    boards = [(file_path, _fast_json.load(f))]
+            self._board_cache.clear()
+            self._board_cache[key] = boards
+        return boards
+
+    def cleanup_temp_files(self) -> None:
+        """Clean up temporary files and drop cached boards and trees."""
+        self._board_cache.clear()
+        self._tree_cache.clear()
+        super().cleanup_temp_files()
+
+    def _collect_tree_texts(self, tree: AACTree) -> None:
+        """Append page names, labels and vocalizations to collected_texts.
+
+        Args:
+            tree: Tree to collect texts from.
+        """
+        append = self.collected_texts.append
+        for page in tree.pages.values():
+            if page.name:
+                append(page.name)
+            for button in page.buttons:
+                label = button.label
+                if label:
+                    append(label)
+                vocalization = button.vocalization
+                if vocalization and vocalization != label:
+                    append(vocalization)
+
+    def _apply_translations(self, tree: AACTree, translations: dict[str, str]) -> None:
+        """Replace page names, labels and vocalizations that have a translation.
+
+        Args:
+            tree: Tree to translate in place.
+            translations: Dictionary of translations.
+        """
+        tget = translations.get
+        for page in tree.pages.values():
+            new = tget(page.name)
+            if new is not None:
+                page.name = new
+            for button in page.buttons:
+                new = tget(button.label)
+                if new is not None:
+                    button.label = new
+                new = tget(button.vocalization)
+                if new is not None:
+                    button.vocalization = new
+
+    def _translate_board_json(
+        self, board: dict[str, Any], translations: dict[str, str]
+    ) -> dict[str, Any]:
+        """Translate the name, labels and vocalizations of a parsed board.
+
+        The board is not modified: the result is a shallow copy with copies
+        of the buttons that changed, so every other field is kept as it was.
+
+        Args:
+            board: Parsed OBF board.
+            translations: Dictionary of translations.
+
+        Returns:
+            Dict[str, Any]: Translated board.
+        """
+        tget = translations.get
+        board = dict(board)
+        name = board.get("name")
+        if isinstance(name, str):
+            new = tget(name)
+            if new is not None:
+                board["name"] = new
+
+        buttons = []
+        for button in board.get("buttons", ()):
+            copied = False
+            for key in ("label", "vocalization"):
+                text = button.get(key)
+                if not isinstance(text, str):
+                    continue
+                new = tget(text)
+                if new is not None:
+                    if not copied:
+                        button = dict(button)
+                        copied = True
+                    button[key] = new
+            buttons.append(button)
+        if "buttons" in board:
+            board["buttons"] = buttons
+        return board
+
+    def _write_obz(self, directory: str, output_path: str) -> None:
+        """Zip a directory of boards and media into an OBZ file.
+
+        Images and sounds are stored as they are, since deflating them again
+        gains next to nothing. Boards and the manifest are compressed with
+        obz_compression at ARCHIVE_COMPRESSLEVEL.
+
+        Args:
+            directory: Directory holding manifest.json and the boards.
+            output_path: Path of the OBZ file to write.
+        """
+        # Archive name the output would have if it is inside the directory,
+        # so entries are compared by name instead of each being made absolute
+        output_arc_name: Optional[str]
+        try:
+            output_arc_name = os.path.relpath(
+                os.path.abspath(output_path), os.path.abspath(directory)
+            )
+        except ValueError:  # On another Windows drive
+            output_arc_name = None
+        with _zip_accel.ZipFile(
+            output_path, "w", self.obz_compression, compresslevel=ARCHIVE_COMPRESSLEVEL
+        ) as zip_ref:
+            for entry, arc_name in iter_archive_entries(directory):
+                if arc_name == output_arc_name:
+                    continue
+                self._write_archive_member(
+                    zip_ref, entry.path, arc_name.replace(os.sep, "/"), entry.stat()
+                )
+
+    @staticmethod
+    def _new_member(name: str) -> zipfile.ZipInfo:
+        """Create metadata for a member written now, readable by everyone."""
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.external_attr = 0o644 << 16
+        return info
+
+    def _write_translated_obz(
+        self, file_path: str, translations: dict[str, str], output_path: str
+    ) -> None:
+        """Write a translated copy of an OBZ file without extracting it.
+
+        Boards listed in the manifest are translated as JSON, without
+        building a tree, and written straight into the new archive. All
+        other members are copied without being recompressed, so they keep
+        their compression method.
+
+        Args:
+            file_path: Path to the source OBZ file.
+            translations: Dictionary of translations.
+            output_path: Path of the OBZ file to write.
+        """
+        with _zip_accel.ZipFile(file_path, "r") as source, _zip_accel.ZipFile(
+            output_path, "w", self.obz_compression, compresslevel=ARCHIVE_COMPRESSLEVEL
+        ) as target:
+            boards: dict[str, dict[str, Any]] = {}
+            if "manifest.json" in source.namelist():
+                boards = {
+                    posixpath.normpath(board_path): board_data
+                    for board_path, board_data in self._load_boards_cached(file_path)
+                }
+
+            for info in source.infolist():
+                if info.is_dir():
+                    continue
+                board_data = boards.get(info.filename)
+                if board_data is None:
+                    copy_archive_member(source, info, target)
+                    continue
+                board_data = self._translate_board_json(board_data, translations)
+                data = _fast_json.dumps(board_data)
+                write_archive_data(target, self._new_member(info.filename), data)
+
+    def _iter_obz_boards(self, file_path: str) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Read the boards listed in an OBZ manifest without extracting it.
+
+        Boards larger than PARALLEL_EXTRACT_MIN_SIZE are read ahead on a
+        thread pool, each thread with its own ZipFile handle, since zlib
+        releases the GIL while decompressing. Boards are still yielded in
+        manifest order.
+
+        Args:
+            file_path: Path to the OBZ file.
+
+        Yields:
+            Tuples of (board path, parsed board) for each board in the archive.
+
+        Raises:
+            ValueError: If the archive has no manifest.json.
+        """
+        with _zip_accel.ZipFile(file_path, "r") as zip_ref:
+            names = set(zip_ref.namelist())
+            if "manifest.json" not in names:
+                raise _MissingManifestError("Invalid OBZ file: missing manifest.json")
+
+            manifest = _fast_json.loads(zip_ref.read("manifest.json"))
+            boards = manifest.get("paths", {}).get("boards", {})
+            members = [
+                (board_path, name)
+                for board_path in boards.values()
+                if (name := posixpath.normpath(board_path)) in names
+            ]
+
+            large = {
+                name
+                for _, name in members
+                if zip_ref.getinfo(name).file_size > PARALLEL_EXTRACT_MIN_SIZE
+            }
+            read_ahead: dict[str, Any] = {}
+            if len(large) > 1:
+                local = threading.local()
+                handles: list[zipfile.ZipFile] = []
+
+                def read(name: str) -> Any:
+                    handle = getattr(local, "zip_ref", None)
+                    if handle is None:
+                        handle = local.zip_ref = _zip_accel.ZipFile(file_path, "r")
+                        handles.append(handle)
+                    return _fast_json.loads(handle.read(name))
+
+                workers = min(os.cpu_count() or 1, len(large))
+                try:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        read_ahead = dict(zip(large, executor.map(read, large)))
+                finally:
+                    for handle in handles:
+                        handle.close()
+
+            for board_path, name in members:
+                if name in read_ahead:
+                    yield board_path, read_ahead[name]
+                else:
+                    yield board_path, _fast_json.loads(zip_ref.read(name))
+
     def _convert_page_to_board(self, page: AACPage, tree: AACTree) -> dict[str, Any]:
         """Convert a page to a board format.
 
@@ -178,7 +493,14 @@ class CoughDropProcessor(FileProcessor):
         # Keep track of added symbols to avoid duplicates in images_data
         # Map symbol content representation (url, datahash, lib+id) to its OBF image_id
         added_symbol_map: dict[str, str] = {}
+        # Content digest of each inline data object, keyed by id()
+        data_digests: dict[int, str] = {}
         next_image_id_counter = 0
+        # Row-major index of the first cell that may still be free. Filled
+        # cells never become free again, so fallback placement resumes there
+        next_free = 0
+        # Whether any button got a cell, so the grid needs no rebuild
+        any_placed = False
 
         # First pass: Create all buttons and track their positions
         for button in page.buttons:
@@ -195,7 +517,6 @@ class CoughDropProcessor(FileProcessor):
             # Add image if present
             if button.symbol:
                 symbol = button.symbol
-                image_id = None
                 symbol_key = None  # Key to check if this exact symbol data is already added
 
                 # Create base image entry with dimensions
@@ -209,28 +530,37 @@ class CoughDropProcessor(FileProcessor):
                     symbol_key = symbol.url
                     base_image["url"] = symbol.url
                 elif symbol.data:
-                    # Use hash of data as key to avoid duplicates
-                    symbol_key = str(hash(symbol.data))
-                    # Add data URI scheme prefix if not present
+                    # Key inline data by a digest of its content. Buttons often
+                    # share one payload, so each object is only hashed once.
                     data = symbol.data
-                    if isinstance(data, bytes):
-                        # Convert bytes to base64 string if needed
-                        import base64
-                        data = base64.b64encode(data).decode('utf-8')
-                    if not isinstance(data, str):
-                        data = str(data)
-                    if not data.startswith('data:'):
-                        data = f"data:{base_image['content_type']};base64,{data}"
-                    base_image["data"] = data
+                    symbol_key = data_digests.get(id(data))
+                    if symbol_key is None:
+                        payload = (
+                            data
+                            if isinstance(data, (bytes, bytearray))
+                            else str(data).encode("utf-8", "surrogatepass")
+                        )
+                        symbol_key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+                        data_digests[id(data)] = symbol_key
+                    # Only encode data for the first button that uses it
+                    if symbol_key not in added_symbol_map:
+                        # Add data URI scheme prefix if not present
+                        if isinstance(data, bytes):
+                            # Convert bytes to base64 string if needed
+                            data = base64.b64encode(data).decode('utf-8')
+                        if not isinstance(data, str):
+                            data = str(data)
+                        if not data.startswith('data:'):
+                            data = f"data:{base_image['content_type']};base64,{data}"
+                        base_image["data"] = data
                 elif symbol.library and symbol.identifier:
                     symbol_key = f"{symbol.library}:{symbol.identifier}"
                     base_image["symbol_set"] = symbol.library
                     base_image["symbol_key"] = symbol.identifier
 
-                if symbol_key in added_symbol_map:
-                    # Reuse existing image_id if we've seen this symbol before
-                    image_id = added_symbol_map[symbol_key]
-                else:
+                # Reuse existing image_id if we've seen this symbol before
+                image_id = added_symbol_map.get(symbol_key)
+                if image_id is None:
                     # Create new image entry
                     image_id = str(next_image_id_counter)
                     next_image_id_counter += 1
@@ -256,17 +586,16 @@ class CoughDropProcessor(FileProcessor):
             y, x = button.position
             if 0 <= y < rows and 0 <= x < cols:
                 grid_order[y][x] = button.id
+                any_placed = True
             else:
                 # If button position is outside grid, append to first available spot
-                placed = False
-                for i in range(rows):
-                    if placed:
+                while next_free < rows * cols:
+                    i, j = divmod(next_free, cols)
+                    next_free += 1
+                    if grid_order[i][j] is None:
+                        grid_order[i][j] = button.id
+                        any_placed = True
                         break
-                    for j in range(cols):
-                        if grid_order[i][j] is None:
-                            grid_order[i][j] = button.id
-                            placed = True
-                            break
 
             buttons_data.append(button_data)
 
@@ -289,7 +618,7 @@ class CoughDropProcessor(FileProcessor):
 
         # For pages with buttons, ensure grid only references existing button IDs
         # Calculate minimum grid size needed to fit all buttons
-        if not any(any(cell is not None for cell in row) for row in grid_order):
+        if not any_placed:
             # No buttons were placed in their original positions
             # Calculate a reasonable grid size based on number of buttons
             button_count = len(buttons_data)
@@ -305,16 +634,22 @@ class CoughDropProcessor(FileProcessor):
                         grid_order[i][j] = buttons_data[button_idx]["id"]
                         button_idx += 1
 
-        # Ensure all cells contain either a valid button ID or None
-        final_grid_order = []
-        for row in grid_order:
-            final_row = []
-            for cell in row:
-                if cell and any(b["id"] == cell for b in buttons_data):
-                    final_row.append(cell)
-                else:
-                    final_row.append(None)
-            final_grid_order.append(final_row)
+        # Ensure all cells contain either a valid button ID or None. Cells
+        # only ever receive ids from buttons_data, so the grid is already
+        # valid unless some button has an empty id.
+        button_ids = {b["id"] for b in buttons_data}
+        if all(button_ids):
+            final_grid_order = grid_order
+        else:
+            final_grid_order = []
+            for row in grid_order:
+                final_row = []
+                for cell in row:
+                    if cell and cell in button_ids:
+                        final_row.append(cell)
+                    else:
+                        final_row.append(None)
+                final_grid_order.append(final_row)
 
         return {
             "format": "open-board-0.1",
@@ -348,137 +683,68 @@ class CoughDropProcessor(FileProcessor):
             Union[List[str], str, None]: List of texts if extracting,
             path to translated file if translating, None if error.
         """
+        temp_output: Optional[str] = None
         try:
             # Reset state for new translation
             self.collected_texts = []
+            self._tree_cache.clear()
             self.file_path = file_path
             self.original_file_path = file_path
             self.original_filename = os.path.splitext(os.path.basename(file_path))[0]
 
-            # Create temp directory for processing
-            temp_dir = tempfile.mkdtemp()
-
-            # Copy file to temp directory
-            temp_file = os.path.join(temp_dir, os.path.basename(file_path))
-            shutil.copy2(file_path, temp_file)
-
-            if file_path.endswith(".obz"):
-                # Extract OBZ file
-                extract_dir = os.path.join(temp_dir, "extracted")
-                os.makedirs(extract_dir, exist_ok=True)
-
-                with zipfile.ZipFile(temp_file, "r") as zip_ref:
-                    zip_ref.extractall(extract_dir)
-
-                # Process all board files
-                manifest_path = os.path.join(extract_dir, "manifest.json")
-                if os.path.exists(manifest_path):
-                    with open(manifest_path, encoding="utf-8") as f:
-                        manifest = json.load(f)
-                        paths = manifest.get("paths", {})
-                        boards = paths.get("boards", {})
-
-                        # Process each board file
-                        for board_path in boards.values():
-                            board_file = os.path.join(extract_dir, board_path)
-                            if os.path.exists(board_file):
-                                tree = self.load_into_tree(board_file)
-                                if translations is None:
-                                    # Extract texts
-                                    for page in tree.pages.values():
-                                        if page.name:
-                                            self.collected_texts.append(page.name)
-                                        for button in page.buttons:
-                                            if button.label:
-                                                self.collected_texts.append(button.label)
-                                            if (
-                                                button.vocalization
-                                                and button.vocalization != button.label
-                                            ):
-                                                self.collected_texts.append(
-                                                    button.vocalization
-                                                )
-                                else:
-                                    # Apply translations
-                                    for page in tree.pages.values():
-                                        if page.name in translations:
-                                            page.name = translations[page.name]
-                                        for button in page.buttons:
-                                            if button.label in translations:
-                                                button.label = translations[button.label]
-                                            if button.vocalization in translations:
-                                                button.vocalization = translations[
-                                                    button.vocalization
-                                                ]
-                                    self.save_from_tree(tree, board_file)
-            else:
-                # Process single OBF file
-                tree = self.load_into_tree(temp_file)
-                if translations is None:
-                    # Extract texts
-                    for page in tree.pages.values():
-                        if page.name:
-                            self.collected_texts.append(page.name)
-                        for button in page.buttons:
-                            if button.label:
-                                self.collected_texts.append(button.label)
-                            if (
-                                button.vocalization
-                                and button.vocalization != button.label
-                            ):
-                                self.collected_texts.append(button.vocalization)
-                else:
-                    # Apply translations
-                    for page in tree.pages.values():
-                        if page.name in translations:
-                            page.name = translations[page.name]
-                        for button in page.buttons:
-                            if button.label in translations:
-                                button.label = translations[button.label]
-                            if button.vocalization in translations:
-                                button.vocalization = translations[button.vocalization]
-                    self.save_from_tree(tree, temp_file)
-
             if translations is None:
+                # Extraction only reads the boards, so nothing touches disk.
+                # An OBZ without a manifest has no boards and no texts
+                try:
+                    self.collected_texts.extend(self.extract_texts_raw(file_path))
+                except _MissingManifestError:
+                    pass
                 return self.collected_texts
 
+            # The translated file is written to the session workspace, which
+            # is reused across calls, and then moved into place. The source
+            # file is only read, so it is not copied there first.
+            temp_dir = self.get_session_workspace()
+
             # Create output file
             if file_path.endswith(".obz"):
                 target_lang = translations.get("target_lang", "translated")
                 output_name = f"{self.original_filename}_{target_lang}.obz"
                 temp_output = os.path.join(temp_dir, output_name)
-                with zipfile.ZipFile(temp_output, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-                    for root, _dirs, files in os.walk(extract_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arc_name = os.path.relpath(file_path, extract_dir)
-                            zip_ref.write(file_path, arc_name)
-                # Move to permanent location
+                self._write_translated_obz(file_path, translations, temp_output)
+                # Rename into place, copying only across filesystems
                 final_output = output_path or os.path.join(
                     os.path.dirname(self.original_file_path), output_name
                 )
-                shutil.copy2(temp_output, final_output)
+                self._deliver_result(temp_output, final_output)
                 return final_output
             else:
-                # For single OBF file
+                # Process single OBF file
+                tree = self._load_tree_cached(file_path)
+                # Apply translations
+                self._apply_translations(tree, translations)
+
                 original_ext = os.path.splitext(self.original_file_path)[1]
                 target_lang = translations.get("target_lang", "translated")
                 output_name = f"{self.original_filename}_{target_lang}{original_ext}"
                 temp_output = os.path.join(temp_dir, output_name)
-                shutil.copy2(temp_file, temp_output)
-                # Move to permanent location
+                self.save_from_tree(tree, temp_output)
+                # Rename into place, copying only across filesystems
                 final_output = output_path or os.path.join(
                     os.path.dirname(self.original_file_path), output_name
                 )
-                shutil.copy2(temp_output, final_output)
+                self._deliver_result(temp_output, final_output)
                 return final_output
 
         except Exception as e:
             self.debug(f"Error processing texts: {e}")
             return None
         finally:
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            self._tree_cache.clear()
+            # Left behind if writing failed or the result was copied across
+            # filesystems
+            if temp_output and os.path.exists(temp_output):
+                os.remove(temp_output)
 
     def process_files(
         self, directory: str, translations: Optional[dict[str, str]] = None
@@ -492,21 +758,15 @@ class CoughDropProcessor(FileProcessor):
         Returns:
             Optional[str]: Path to translated file if successful, None otherwise.
         """
+        self._tree_cache.clear()
         try:
             # For single .obf file, process it directly
             if self.file_path and self.file_path.endswith(".obf"):
                 self.debug(f"Processing single OBF file: {self.file_path}")
-                tree = self.load_into_tree(self.file_path)
+                tree = self._load_tree_cached(self.file_path)
                 if translations:
                     # Apply translations
-                    for page in tree.pages.values():
-                        if page.name in translations:
-                            page.name = translations[page.name]
-                        for button in page.buttons:
-                            if button.label in translations:
-                                button.label = translations[button.label]
-                            if button.vocalization in translations:
-                                button.vocalization = translations[button.vocalization]
+                    self._apply_translations(tree, translations)
                     # Save translated tree
                     output_path = os.path.join(
                         directory, os.path.basename(self.file_path)
@@ -515,113 +775,62 @@ class CoughDropProcessor(FileProcessor):
                     return output_path
                 else:
                     # Extract texts
-                    for page in tree.pages.values():
-                        if page.name:
-                            self.collected_texts.append(page.name)
-                        for button in page.buttons:
-                            if button.label:
-                                self.collected_texts.append(button.label)
-                            if (
-                                button.vocalization
-                                and button.vocalization != button.label
-                            ):
-                                self.collected_texts.append(button.vocalization)
+                    self._collect_tree_texts(tree)
                     return None
 
             # Look for manifest.json first (for .obz files)
+            # Boards and the manifest are opened directly, missing ones
+            # caught, rather than checked with an extra stat each
             manifest_path = os.path.join(directory, "manifest.json")
-            if os.path.exists(manifest_path):
-                with open(manifest_path, encoding="utf-8") as f:
-                    manifest = json.load(f)
-                    paths = manifest.get("paths", {})
-                    boards = paths.get("boards", {})
-
-                    # Process each board file
-                    for board_path in boards.values():
-                        board_file = os.path.join(directory, board_path)
-                        if os.path.exists(board_file):
-                            tree = self.load_into_tree(board_file)
-                            if translations:
-                                # Apply translations
-                                for page in tree.pages.values():
-                                    if page.name in translations:
-                                        page.name = translations[page.name]
-
-                                    for button in page.buttons:
-                                        if button.label in translations:
-                                            button.label = translations[button.label]
-                                        if button.vocalization in translations:
-                                            button.vocalization = translations[
-                                                button.vocalization
-                                            ]
-
-                                # Save translated tree
-                                self.save_from_tree(tree, board_file)
-                            else:
-                                # Extract texts
-                                for page in tree.pages.values():
-                                    if page.name:
-                                        self.collected_texts.append(page.name)
-
-                                    for button in page.buttons:
-                                        if button.label:
-                                            self.collected_texts.append(button.label)
-                                        if (
-                                            button.vocalization
-                                            and button.vocalization != button.label
-                                        ):
-                                            self.collected_texts.append(
-                                                button.vocalization
-                                            )
+            try:
+                with open(manifest_path, "rb") as f:
+                    manifest = _fast_json.load(f)
+                has_manifest = True
+            except FileNotFoundError:
+                has_manifest = False
+
+            if has_manifest:
+                paths = manifest.get("paths", {})
+                boards = paths.get("boards", {})
+
+                # Process each board file
+                for board_path in boards.values():
+                    board_file = os.path.join(directory, board_path)
+                    try:
+                        tree = self._load_tree_cached(board_file)
+                    except FileNotFoundError:
+                        self.debug(f"Missing board file: {board_path}")
+                        continue
+                    if translations:
+                        # Apply translations
+                        self._apply_translations(tree, translations)
+
+                        # Save translated tree
+                        self.save_from_tree(tree, board_file)
+                    else:
+                        # Extract texts
+                        self._collect_tree_texts(tree)
             else:
                 # Look for individual .obf files
                 for file in os.listdir(directory):
                     if file.endswith(".obf"):
                         file_path = os.path.join(directory, file)
-                        tree = self.load_into_tree(file_path)
+                        tree = self._load_tree_cached(file_path)
                         if translations:
                             # Apply translations
-                            for page in tree.pages.values():
-                                if page.name in translations:
-                                    page.name = translations[page.name]
-
-                                for button in page.buttons:
-                                    if button.label in translations:
-                                        button.label = translations[button.label]
-                                    if button.vocalization in translations:
-                                        button.vocalization = translations[
-                                            button.vocalization
-                                        ]
+                            self._apply_translations(tree, translations)
 
                             # Save translated tree
                             self.save_from_tree(tree, file_path)
                         else:
                             # Extract texts
-                            for page in tree.pages.values():
-                                if page.name:
-                                    self.collected_texts.append(page.name)
-
-                                for button in page.buttons:
-                                    if button.label:
-                                        self.collected_texts.append(button.label)
-                                    if (
-                                        button.vocalization
-                                        and button.vocalization != button.label
-                                    ):
-                                        self.collected_texts.append(button.vocalization)
+                            self._collect_tree_texts(tree)
 
             # If translations were applied, create new file
             if translations:
                 output_path = self.get_output_path(translations.get("target_lang"))
                 if self.file_path and self.file_path.endswith(".obz"):
-                    with zipfile.ZipFile(
-                        output_path, "w", zipfile.ZIP_DEFLATED
-                    ) as zip_ref:
-                        for root, _, files in os.walk(directory):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                arc_name = os.path.relpath(file_path, directory)
-                                zip_ref.write(file_path, arc_name)
+                    self._write_obz(directory, output_path)
                 else:
                     # For single OBF file, just copy the translated file
                     for file in os.listdir(directory):
@@ -647,32 +856,11 @@ class CoughDropProcessor(FileProcessor):
             AACTree: Tree structure representing the file contents.
         """
         tree = AACTree()
-        temp_dir = self.create_temp_dir()
 
         try:
-            if file_path.endswith(".obz"):
-                # Extract OBZ file
-                with zipfile.ZipFile(file_path, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Read manifest
-                manifest_path = os.path.join(temp_dir, "manifest.json")
-                if not os.path.exists(manifest_path):
-                    raise ValueError("Invalid OBZ file: missing manifest.json")
-
-                with open(manifest_path, encoding="utf-8") as f:
-                    manifest = json.load(f)
-                    paths = manifest.get("paths", {})
-                    boards = paths.get("boards", {})
-
-                    # Process each board file
-                    for _board_id, board_path in boards.items():
-                        full_path = os.path.join(temp_dir, board_path)
-                        if os.path.exists(full_path):
-                            self._load_board_into_tree(full_path, tree)
-            else:
-                # Single OBF file
-                self._load_board_into_tree(file_path, tree)
+            # OBZ boards are read straight from the archive
+            for board_path, board_data in self._load_boards_cached(file_path):
+                self._load_board_into_tree(board_path, tree, board_data)
 
             return tree
 
@@ -680,37 +868,32 @@ class CoughDropProcessor(FileProcessor):
             self.debug(f"Error loading tree: {str(e)}")
             raise
 
-    def save_from_tree(self, tree: AACTree, output_path: str) -> None:
+    def save_from_tree(
+        self, tree: AACTree, output_path: str, pretty: bool = False
+    ) -> None:
         """Save tree to OBF/OBZ format.
 
         Args:
             tree (AACTree): Tree to save.
             output_path (str): Path where to save the file.
+            pretty (bool): Indent the JSON instead of writing it compactly.
         """
-        temp_dir = self.create_temp_dir()
-
+        # The output may overwrite a file whose boards are cached
+        self._board_cache.clear()
         try:
-            if output_path.endswith(".obz"):
-                # Create boards directory
-                boards_dir = os.path.join(temp_dir, "boards")
-                os.makedirs(boards_dir, exist_ok=True)
+            if not tree.pages:
+                raise ValueError("No pages to save")
 
-                # Save each page as a board file
+            if output_path.endswith(".obz"):
+                # Serialize each page as a board file
                 board_paths = {}
+                boards: dict[str, bytes] = {}
                 for page_id, page in tree.pages.items():
-                    board_file = f"{page_id}.obf"
-                    board_path = os.path.join("boards", board_file)
-                    full_path = os.path.join(temp_dir, board_path)
-
+                    board_path = f"boards/{page_id}.obf"
                     board_data = self._convert_page_to_board(page, tree)
-                    with open(full_path, "w", encoding="utf-8") as f:
-                        json.dump(board_data, f, indent=2)
-
+                    boards[board_path] = _fast_json.dumps(board_data, indent=pretty)
                     board_paths[page_id] = board_path
 
-                if not board_paths:
-                    raise ValueError("No pages to save")
-
                 # Create manifest
                 root_id = next(iter(tree.pages))
                 manifest = {
@@ -719,18 +902,20 @@ class CoughDropProcessor(FileProcessor):
                     "paths": {"boards": board_paths, "images": {}, "sounds": {}},
                 }
 
-                # Save manifest
-                manifest_path = os.path.join(temp_dir, "manifest.json")
-                with open(manifest_path, "w", encoding="utf-8") as f:
-                    json.dump(manifest, f, indent=2)
-
-                # Create OBZ file
-                with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-                    for root, _dirs, files in os.walk(temp_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arc_name = os.path.relpath(file_path, temp_dir)
-                            zip_ref.write(file_path, arc_name)
+                # Create OBZ file straight from the serialized boards
+                with _zip_accel.ZipFile(
+                    output_path,
+                    "w",
+                    self.obz_compression,
+                    compresslevel=ARCHIVE_COMPRESSLEVEL,
+                ) as zip_ref:
+                    write_archive_data(
+                        zip_ref,
+                        self._new_member("manifest.json"),
+                        _fast_json.dumps(manifest, indent=pretty),
+                    )
+                    for board_path, data in boards.items():
+                        write_archive_data(zip_ref, self._new_member(board_path), data)
             else:
                 # Save single OBF file
                 if len(tree.pages) > 1:
@@ -738,13 +923,37 @@ class CoughDropProcessor(FileProcessor):
 
                 page = next(iter(tree.pages.values()))
                 board_data = self._convert_page_to_board(page, tree)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(board_data, f, indent=2)
+                with open(output_path, "wb") as f:
+                    _fast_json.dump(board_data, f, indent=pretty)
 
         except Exception as e:
             self.debug(f"Error saving tree: {str(e)}")
             raise
 
+    def extract_texts_raw(self, file_path: str) -> Iterator[str]:
+        """Stream texts from an OBF or OBZ file without building an AACTree.
+
+        Texts are read straight from the parsed boards, in the order
+        _collect_tree_texts would collect them from the loaded tree.
+
+        Args:
+            file_path (str): Path to the OBF or OBZ file.
+
+        Yields:
+            Each board name, button label and distinct vocalization.
+        """
+        for _, board in self._load_boards_cached(file_path):
+            name = board.get("name", "")
+            if name:
+                yield name
+            for button in board.get("buttons", ()):
+                label = button.get("label", "")
+                if label:
+                    yield label
+                vocalization = button.get("vocalization", "")
+                if vocalization and vocalization != label:
+                    yield vocalization
+
     def extract_texts(self, file_path: str) -> list[str]:
         """Extract translatable texts from OBF/OBZ file.
 
@@ -760,60 +969,30 @@ class CoughDropProcessor(FileProcessor):
         return []
 
     def create_translated_file(
-        self, file_path: str, translations: dict[str, str]
+        self,
+        file_path: str,
+        translations: dict[str, str],
+        *,
+        workdir: Optional[str] = None,
     ) -> Optional[str]:
         """Create a translated version of the file.
 
         Args:
             file_path (str): Path to the file to translate.
             translations (Dict[str, str]): Dictionary of translations.
+            workdir (Optional[str]): Existing directory to write the result
+                to, so translating into several languages can share one
+                directory. The caller owns it and it is not cleaned up. By
+                default a new temporary directory is created.
 
         Returns:
             Optional[str]: Path to translated file or None if error occurred.
         """
         try:
-            temp_dir = self.create_temp_dir()
-
-            # Copy original file to temp dir
-            temp_file = os.path.join(temp_dir, os.path.basename(file_path))
-            shutil.copy2(file_path, temp_file)
+            temp_dir = workdir or self.create_temp_dir()
 
             # Process translations
             if file_path.endswith(".obz"):
-                # Extract OBZ file
-                extract_dir = os.path.join(temp_dir, "extracted")
-                os.makedirs(extract_dir, exist_ok=True)
-
-                with zipfile.ZipFile(temp_file, "r") as zip_ref:
-                    zip_ref.extractall(extract_dir)
-
-                # Process all board files
-                manifest_path = os.path.join(extract_dir, "manifest.json")
-                if os.path.exists(manifest_path):
-                    with open(manifest_path, encoding="utf-8") as f:
-                        manifest = json.load(f)
-                        paths = manifest.get("paths", {})
-                        boards = paths.get("boards", {})
-
-                        # Process each board file
-                        for board_path in boards.values():
-                            board_file = os.path.join(extract_dir, board_path)
-                            if os.path.exists(board_file):
-                                tree = self.load_into_tree(board_file)
-                                for page in tree.pages.values():
-                                    if page.name in translations:
-                                        page.name = translations[page.name]
-
-                                    for button in page.buttons:
-                                        if button.label in translations:
-                                            button.label = translations[button.label]
-                                        if button.vocalization in translations:
-                                            button.vocalization = translations[
-                                                button.vocalization
-                                            ]
-
-                                self.save_from_tree(tree, board_file)
-
                 # Create new OBZ file with target language code
                 base_name = os.path.splitext(os.path.basename(file_path))[0]
                 target_lang = translations.get("target_lang")
@@ -832,29 +1011,11 @@ class CoughDropProcessor(FileProcessor):
                 output_name = f"{base_name}_{target_lang}.obz"
                 output_path = os.path.join(temp_dir, output_name)
 
-                with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-                    for root, _, files in os.walk(extract_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arc_name = os.path.relpath(file_path, extract_dir)
-                            zip_ref.write(file_path, arc_name)
+                # Boards are translated in memory while the archive is copied
+                self._write_translated_obz(file_path, translations, output_path)
 
                 return output_path
             else:
-                # Process single OBF file
-                tree = self.load_into_tree(temp_file)
-                for page in tree.pages.values():
-                    if page.name in translations:
-                        page.name = translations[page.name]
-
-                    for button in page.buttons:
-                        if button.label in translations:
-                            button.label = translations[button.label]
-                        if button.vocalization in translations:
-                            button.vocalization = translations[button.vocalization]
-
-                self.save_from_tree(tree, temp_file)
-
                 # Create output path with target language code
                 base_name = os.path.splitext(os.path.basename(file_path))[0]
                 target_lang = translations.get("target_lang")
@@ -872,7 +1033,11 @@ class CoughDropProcessor(FileProcessor):
 
                 output_name = f"{base_name}_{target_lang}.obf"
                 output_path = os.path.join(temp_dir, output_name)
-                shutil.move(temp_file, output_path)
+
+                # The source board is only read, so it is not copied first
+                tree = self.load_into_tree(file_path)
+                self._apply_translations(tree, translations)
+                self.save_from_tree(tree, output_path)
                 return output_path
 
         except Exception as e:
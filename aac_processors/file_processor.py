@@ -44,11 +44,12 @@ class FileProcessor(AACProcessor):
         return temp_dir
 
     def cleanup_temp_files(self) -> None:
-        """Clean up temporary files."""
+        """Clean up temporary files and the session workspace."""
         for temp_dir in self._temp_dirs:
             if os.path.exists(temp_dir):
                 shutil.rmtree(temp_dir)
         self._temp_dirs = []
+        super().cleanup_temp_files()
 
     def _prepare_workspace(self, file_path: str) -> str:
         """Prepare workspace for processing.
@@ -228,6 +229,20 @@ class FileProcessor(AACProcessor):
             self.collected_texts = []
             self.set_source_file(file_path)
 
+            if translations is None and not include_context:
+                # Plain texts are read straight from the file, skipping the
+                # extract and process_files pass
+                return list(self.extract_texts_raw(file_path))
+
+            if (
+                translations is not None
+                and output_path
+                and type(self).write_translated_file
+                is not AACProcessor.write_translated_file
+            ):
+                # The processor writes its output directly, no staging copy
+                return self.write_translated_file(file_path, translations, output_path)
+
             # Create temp directory for processing
             temp_dir = self.create_temp_dir()
 
@@ -1,7 +1,8 @@
 import logging
 import os
 import zipfile
-from typing import Any, Optional, Union, cast
+from collections.abc import Iterator
+from typing import IO, Any, Optional, Union, cast
 
 from lxml import etree
 from lxml.etree import _Element, _ElementTree
@@ -12,6 +13,54 @@ from .tree_structure import AACButton, AACPage, AACTree, ButtonType
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Ancestors, nearest first, of the word list <Text> elements holding texts
+_WORDLIST_TEXT_PARENTS = ("WordListItem", "Items", "WordList")
+
+
+def _iter_grid_texts(source: IO[bytes]) -> Iterator[str]:
+    """Yield the translatable texts of one grid.xml document.
+
+    Covers the grid Name, .//CaptionAndImage/Caption and
+    .//WordList/Items/WordListItem/Text. Elements are cleared as soon as they
+    have been read so large grids are never held in memory as a whole.
+
+    Args:
+        source: Binary file object with the grid XML
+
+    Yields:
+        Each text in document order
+    """
+    root = None
+    for event, element in etree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+                name = element.get("Name")
+                if name:
+                    yield name
+            continue
+
+        tag = element.tag
+        if tag == "Caption":
+            parent = element.getparent()
+            if parent is not None and parent.tag == "CaptionAndImage":
+                if element.text and element.text.strip():
+                    yield element.text.strip()
+        elif tag == "Text":
+            ancestor = element.getparent()
+            for expected in _WORDLIST_TEXT_PARENTS:
+                if ancestor is None or ancestor.tag != expected:
+                    break
+                ancestor = ancestor.getparent()
+            else:
+                if element.text and element.text.strip():
+                    yield element.text.strip()
+
+        element.clear()
+        # Drop finished siblings as well, keeping only the open ancestors
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
 
 class GridsetProcessor(FileProcessor):
     """Processor for Grid3 files (.gridset)."""
@@ -293,6 +342,37 @@ class GridsetProcessor(FileProcessor):
         """
         return etree.CDATA(text)
 
+    def extract_texts_raw(self, file_path: str) -> Iterator[str]:
+        """Stream texts from a gridset without extracting it.
+
+        Each Grids/<name>/grid.xml is parsed straight out of the archive.
+
+        Args:
+            file_path (str): Path to the gridset file.
+
+        Yields:
+            Each distinct translatable text.
+        """
+        seen: set[str] = set()
+        with zipfile.ZipFile(file_path, "r") as zf:
+            for member in zf.namelist():
+                parts = member.split("/")
+                if (
+                    len(parts) != 3
+                    or parts[0] != "Grids"
+                    or not parts[1]
+                    or parts[2] != "grid.xml"
+                ):
+                    continue
+                try:
+                    with zf.open(member) as grid_file:
+                        for text in _iter_grid_texts(grid_file):
+                            if text not in seen:
+                                seen.add(text)
+                                yield text
+                except Exception as e:
+                    self.debug(f"Error processing grid file {member}: {str(e)}")
+
     def extract_texts(
         self, file_path: str, include_context: bool = False
     ) -> Union[list[str], list[dict[str, Any]]]:
@@ -307,48 +387,7 @@ class GridsetProcessor(FileProcessor):
             If include_context is True: List of dictionaries with context info.
         """
         if not include_context:
-            # Simple text extraction without context
-            texts = []
-            temp_dir = self.create_temp_dir()
-
-            with zipfile.ZipFile(file_path, "r") as zf:
-                zf.extractall(temp_dir)
-
-                # Process each grid.xml file
-                grids_dir = os.path.join(temp_dir, "Grids")
-                if os.path.exists(grids_dir):
-                    for grid_dir in os.listdir(grids_dir):
-                        grid_path = os.path.join(grids_dir, grid_dir, "grid.xml")
-                        if not os.path.exists(grid_path):
-                            continue
-
-                        try:
-                            tree = etree.parse(grid_path)
-                            root = tree.getroot()
-
-                            # Extract grid name
-                            name = root.get("Name")
-                            if name:
-                                texts.append(name)
-
-                            # Extract captions
-                            for caption in root.findall(".//CaptionAndImage/Caption"):
-                                if caption.text and caption.text.strip():
-                                    texts.append(caption.text.strip())
-
-                            # Extract wordlist items
-                            for text in root.findall(
-                                ".//WordList/Items/WordListItem/Text"
-                            ):
-                                if text.text and text.text.strip():
-                                    texts.append(text.text.strip())
-
-                        except Exception as e:
-                            self.debug(
-                                f"Error processing grid file {grid_path}: {str(e)}"
-                            )
-
-            return list(set(texts))  # Remove duplicates
+            return list(self.extract_texts_raw(file_path))
         else:
             # Extract texts with context information
             texts_with_context = []
@@ -73,6 +73,11 @@ class SQLiteProcessor(AACProcessor):
             self.collected_texts = []
             self.set_source_file(file_path)
 
+            if translations is None and include_context:
+                # extract_texts prepares its own workspace, so don't prepare
+                # one here first
+                return self.extract_texts(file_path, include_context=True)
+
             # Prepare workspace and get working directory
             workspace = self._prepare_workspace(file_path)
 
@@ -80,11 +85,7 @@ class SQLiteProcessor(AACProcessor):
             result = self.process_files(workspace, translations)
 
             if translations is None:
-                if include_context:
-                    # Use extract_texts with context info
-                    return self.extract_texts(file_path, include_context=True)
-                else:
-                    return self.collected_texts
+                return self.collected_texts
 
             if result and output_path:
                 self._create_output(workspace, output_path)
@@ -370,8 +371,9 @@ class SQLiteProcessor(AACProcessor):
         Args:
             message (str): Message to output.
         """
-        if self._debug_output:
-            self._debug_output(f"{self.__class__.__name__}: {message}")
+        output = self._debug_output
+        if output is not None:
+            output(f"{self._class_name}: {message}")
 
     def _debug_print(self, message: str) -> None:
         """Print debug message.
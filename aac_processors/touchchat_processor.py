@@ -353,6 +353,7 @@ class TouchChatProcessor(SQLiteProcessor):
                     os.remove(c4v_file)
                     # Move the new database to the original location
                     shutil.move(new_db_path, c4v_file)
+                    self._mark_modified(c4v_file)
                     self.debug(f"Moved translated database to: {c4v_file}")
                     return directory
                 else:
@@ -1,7 +1,12 @@
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
+# Trees can hold thousands of buttons, so the node classes use __slots__ where
+# dataclasses support it (Python 3.10+) to drop the per-instance __dict__.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ButtonType(Enum):
     SPEAK = "speak"
@@ -11,7 +16,7 @@ class ButtonType(Enum):
     COMMAND = "command"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ButtonStyle:
     """Visual properties for buttons"""
 
@@ -26,7 +31,7 @@ class ButtonStyle:
     font_underline: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AACSymbol:
     """Represents a symbol or image used in an AAC button.
 
@@ -121,7 +126,7 @@ class AACSymbol:
             return cls(internal_id=internal_id)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AACButton:
     """Button in an AAC system."""
 
@@ -142,7 +147,7 @@ class AACButton:
     top: Optional[float] = None  # Absolute position from top
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AACPage:
     """Represents a page in an AAC system"""
 
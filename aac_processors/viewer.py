@@ -1,26 +1,40 @@
 #!/usr/bin/env python3
 
+import importlib
 import os
 import sys
-from typing import Optional, Union
-
-from .coughdrop_processor import CoughDropProcessor
-from .dot_processor import DotProcessor
-from .gridset_processor import GridsetProcessor
-from .opml_processor import OPMLProcessor
-from .snap_processor import SnapProcessor
-from .touchchat_processor import TouchChatProcessor
+from typing import TYPE_CHECKING, Optional, Union
+
 from .tree_structure import AACButton, AACPage, AACTree, ButtonType
 
+if TYPE_CHECKING:
+    from .coughdrop_processor import CoughDropProcessor
+    from .dot_processor import DotProcessor
+    from .gridset_processor import GridsetProcessor
+    from .opml_processor import OPMLProcessor
+    from .snap_processor import SnapProcessor
+    from .touchchat_processor import TouchChatProcessor
+
 ProcessorType = Union[
-    GridsetProcessor,
-    TouchChatProcessor,
-    SnapProcessor,
-    CoughDropProcessor,
-    DotProcessor,
-    OPMLProcessor,
+    "GridsetProcessor",
+    "TouchChatProcessor",
+    "SnapProcessor",
+    "CoughDropProcessor",
+    "DotProcessor",
+    "OPMLProcessor",
 ]
 
+# Processors tried by get_processor_for_file, in order, as (module, class).
+# Each module is imported only when detection reaches it.
+_DETECTION_ORDER = (
+    (".gridset_processor", "GridsetProcessor"),
+    (".touchchat_processor", "TouchChatProcessor"),
+    (".snap_processor", "SnapProcessor"),
+    (".coughdrop_processor", "CoughDropProcessor"),
+    (".dot_processor", "DotProcessor"),
+    (".opml_processor", "OPMLProcessor"),
+)
+
 
 def get_processor_for_file(file_path: str) -> Optional[ProcessorType]:
     """Get appropriate processor for file type.
@@ -32,16 +46,9 @@ def get_processor_for_file(file_path: str) -> Optional[ProcessorType]:
         A processor instance that can handle the file type, or None if no suitable
         processor is found.
     """
-    processors: list[ProcessorType] = [
-        GridsetProcessor(),
-        TouchChatProcessor(),
-        SnapProcessor(),
-        CoughDropProcessor(),
-        DotProcessor(),
-        OPMLProcessor(),
-    ]
-
-    for processor in processors:
+    for module, name in _DETECTION_ORDER:
+        processor_class = getattr(importlib.import_module(module, __package__), name)
+        processor: ProcessorType = processor_class()
         if processor.can_process(file_path):
             return processor
 
@@ -1,5 +1,6 @@
 import json
 import os
+import plistlib
 import shutil
 import sqlite3
 import tempfile
@@ -456,6 +457,86 @@ def test_opml_file(temp_dir: str) -> str:
     return opml_path
 
 
+@pytest.fixture
+def test_apple_panels(temp_dir: str) -> str:
+    """Create a test Apple Panels config with XML plists"""
+    config_path = os.path.join(temp_dir, "test.ascconfig")
+    resources_dir = os.path.join(config_path, "Contents", "Resources")
+    os.makedirs(resources_dir)
+
+    info = {"ASCConfigurationDisplayName": "Test", "CFBundleVersion": "1"}
+    with open(os.path.join(config_path, "Contents", "Info.plist"), "wb") as f:
+        plistlib.dump(info, f)
+
+    panels = {
+        "Panels": {
+            "Panel.1": {
+                "ID": "Panel.1",
+                "Name": "Home",
+                "PanelObjects": [
+                    {
+                        "PanelObjectType": "Button",
+                        "ID": "Button.1",
+                        "DisplayText": "Hello",
+                        "DisplayColor": "1.000 0.000 0.000 1.000",
+                        "Rect": "{{0, 0}, {100, 100}}",
+                        "Actions": [
+                            {
+                                "ActionType": "ActionPressKeyCharSequence",
+                                "ActionParam": {"CharString": "Hello there"},
+                            }
+                        ],
+                    },
+                    {
+                        "PanelObjectType": "Button",
+                        "ID": "Button.2",
+                        "DisplayText": "Food",
+                        "Rect": "{{100, 0}, {100, 100}}",
+                        "Actions": [
+                            {
+                                "ActionType": "ActionOpenPanel",
+                                "ActionParam": {"PanelID": "Panel.2"},
+                            }
+                        ],
+                    },
+                    {
+                        "PanelObjectType": "Button",
+                        "ID": "Button.3",
+                        "DisplayText": "",
+                        "Rect": "{{0, 100}, {100, 100}}",
+                    },
+                    {
+                        "PanelObjectType": "Button",
+                        "ID": "Button.4",
+                        "DisplayText": "Hello",
+                        "DisplayColor": "0.000 0.500 1.000 1.000",
+                        "Rect": "{{200, 100}, {100, 100}}",
+                    },
+                    {"PanelObjectType": "GroupBox", "DisplayText": "Group"},
+                ],
+            },
+            "Panel.2": {
+                "ID": "Panel.2",
+                "Name": "Food",
+                "PanelObjects": [
+                    {
+                        "PanelObjectType": "Button",
+                        "ID": "Button.5",
+                        "DisplayText": "Apple",
+                        "Rect": "{{0, 0}, {100, 100}}",
+                    }
+                ],
+            },
+        }
+    }
+    with open(os.path.join(resources_dir, "PanelDefinitions.plist"), "wb") as f:
+        plistlib.dump(panels, f)
+    with open(os.path.join(resources_dir, "Image.1"), "wb") as f:
+        f.write(b"\x89PNG image")
+
+    return config_path
+
+
 def pytest_configure(config: Any) -> None:
     """Register custom marks"""
     config.addinivalue_line("markers", "slow: mark test as slow to run")
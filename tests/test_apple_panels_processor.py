@@ -0,0 +1,217 @@
+import os
+import plistlib
+import threading
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aac_processors import apple_panels_processor
+from aac_processors.apple_panels_processor import ApplePanelsProcessor
+from aac_processors.tree_structure import ButtonType
+
+
+def _read_panels(config_path: str) -> tuple[bytes, dict[str, Any]]:
+    path = os.path.join(config_path, "Contents", "Resources", "PanelDefinitions.plist")
+    with open(path, "rb") as f:
+        data = f.read()
+    return data, plistlib.loads(data)
+
+
+@pytest.mark.parametrize("fmt", [plistlib.FMT_XML, plistlib.FMT_BINARY])
+def test_translate_config(
+    test_apple_panels: str, temp_dir: str, fmt: plistlib.PlistFormat
+) -> None:
+    """Test translating a config keeps its plist format and other resources"""
+    _, panels = _read_panels(test_apple_panels)
+    with open(
+        os.path.join(
+            test_apple_panels, "Contents", "Resources", "PanelDefinitions.plist"
+        ),
+        "wb",
+    ) as f:
+        plistlib.dump(panels, f, fmt=fmt)
+
+    processor = ApplePanelsProcessor()
+    output_path = os.path.join(temp_dir, "translated.ascconfig")
+    translations = {"Hello": "Hola", "Hello there": "Hola a todos", "Food": "Comida"}
+    result = processor.process_texts(test_apple_panels, translations, output_path)
+    assert result == output_path
+
+    data, translated = _read_panels(output_path)
+    assert data.startswith(b"bplist00") == (fmt == plistlib.FMT_BINARY)
+    home = translated["Panels"]["Panel.1"]
+    assert translated["Panels"]["Panel.2"]["Name"] == "Comida"
+    buttons = home["PanelObjects"]
+    assert [obj["DisplayText"] for obj in buttons] == [
+        "Hola",
+        "Comida",
+        "",
+        "Hola",
+        "Group",
+    ]
+    assert buttons[0]["Actions"][0]["ActionParam"]["CharString"] == "Hola a todos"
+    assert buttons[1]["Actions"][0]["ActionParam"] == {"PanelID": "Panel.2"}
+
+    with open(os.path.join(output_path, "Contents", "Resources", "Image.1"), "rb") as f:
+        assert f.read() == b"\x89PNG image"
+    assert os.path.exists(os.path.join(output_path, "Contents", "Info.plist"))
+    # The source is left untouched
+    assert _read_panels(test_apple_panels)[1] == panels
+
+
+@pytest.mark.parametrize("xml", [False, True])
+def test_save_round_trip(test_apple_panels: str, temp_dir: str, xml: bool) -> None:
+    """Test saved configs load back and use binary plists unless xml=True"""
+    processor = ApplePanelsProcessor()
+    tree = processor.load_into_tree(test_apple_panels)
+    output_path = os.path.join(temp_dir, "saved.ascconfig")
+    processor.save_from_tree(tree, output_path, xml=xml)
+
+    resources = os.path.join(output_path, "Contents", "Resources")
+    for path in (
+        os.path.join(output_path, "Contents", "Info.plist"),
+        os.path.join(resources, "PanelDefinitions.plist"),
+        os.path.join(resources, "AssetIndex.plist"),
+    ):
+        with open(path, "rb") as f:
+            assert f.read(8) == (b"<?xml ve" if xml else b"bplist00")
+
+    reloaded = processor.load_into_tree(output_path)
+    assert reloaded.pages.keys() == tree.pages.keys()
+    for page_id, page in tree.pages.items():
+        other = reloaded.pages[page_id]
+        assert other.name == page.name
+        assert [
+            (b.id, b.label, b.type, b.target_page_id, b.vocalization)
+            for b in other.buttons
+        ] == [
+            (b.id, b.label, b.type, b.target_page_id, b.vocalization)
+            for b in page.buttons
+        ]
+    assert reloaded.pages["Panel.1"].buttons[0].style.body_color == "#ff0000"
+
+
+def test_extract_texts_matches_tree(test_apple_panels: str) -> None:
+    """Test the raw plist walk extracts the same texts as the loaded tree"""
+    _, panels = _read_panels(test_apple_panels)
+    # Unnamed panel, and a key sequence repeating the button's own text
+    panels["Panels"]["Panel.3"] = {
+        "PanelObjects": [
+            {
+                "PanelObjectType": "Button",
+                "ID": "Button.6",
+                "DisplayText": "Yes",
+                "Rect": "{{0, 0}, {100, 100}}",
+                "Actions": [
+                    {
+                        "ActionType": "ActionPressKeyCharSequence",
+                        "ActionParam": {"CharString": "Yes"},
+                    }
+                ],
+            }
+        ]
+    }
+    with open(
+        os.path.join(
+            test_apple_panels, "Contents", "Resources", "PanelDefinitions.plist"
+        ),
+        "wb",
+    ) as f:
+        plistlib.dump(panels, f)
+
+    processor = ApplePanelsProcessor()
+    tree = processor.load_into_tree(test_apple_panels)
+    expected = []
+    for page in tree.pages.values():
+        if page.name:
+            expected.append(page.name)
+        for btn in page.buttons:
+            if btn.label:
+                expected.append(btn.label)
+            if btn.vocalization and btn.vocalization != btn.label:
+                expected.append(btn.vocalization)
+
+    texts = processor.extract_texts(test_apple_panels)
+    assert texts == expected
+    assert texts == [
+        "Home",
+        "Hello",
+        "Hello there",
+        "Food",
+        "Hello",
+        "Food",
+        "Apple",
+        "Untitled Panel",
+        "Yes",
+    ]
+
+
+def test_load_into_tree(test_apple_panels: str) -> None:
+    """Test panels load with grid positions, sizes, colours and actions"""
+    tree = ApplePanelsProcessor().load_into_tree(test_apple_panels)
+
+    assert list(tree.pages) == ["Panel.1", "Panel.2"]
+    home = tree.pages["Panel.1"]
+    assert home.name == "Home"
+    # The GroupBox is not a button
+    assert [btn.id for btn in home.buttons] == [
+        "Button.1",
+        "Button.2",
+        "Button.3",
+        "Button.4",
+    ]
+    assert [btn.position for btn in home.buttons] == [(0, 0), (0, 1), (1, 0), (1, 2)]
+    assert home.grid_size == (2, 3)
+    assert [btn.style.body_color for btn in home.buttons] == [
+        "#ff0000",
+        "#ffffff",
+        "#ffffff",
+        "#007fff",
+    ]
+
+    hello, food = home.buttons[0], home.buttons[1]
+    assert hello.type == ButtonType.SPEAK
+    assert hello.vocalization == "Hello there"
+    assert food.type == ButtonType.NAVIGATE
+    assert food.target_page_id == "Panel.2"
+
+    food_page = tree.pages["Panel.2"]
+    assert food_page.grid_size == (1, 1)
+    assert [btn.label for btn in food_page.buttons] == ["Apple"]
+
+
+def test_download_images(temp_dir: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test downloads use one session per thread and a timeout"""
+    calls: list[tuple[int, int, Any]] = []
+    closed: list[int] = []
+
+    class Session:
+        def get(self, url: str, timeout: Any = None) -> Any:
+            calls.append((id(self), threading.get_ident(), timeout))
+            status = 404 if url.endswith("missing") else 200
+            return types.SimpleNamespace(status_code=status, content=url.encode())
+
+        def close(self) -> None:
+            closed.append(id(self))
+
+    fake_requests = types.ModuleType("requests")
+    fake_requests.Session = Session  # type: ignore[attr-defined]
+    monkeypatch.setattr(apple_panels_processor, "_requests", fake_requests)
+
+    downloads = [
+        (f"http://example.com/{i}", Path(temp_dir) / f"Image.{i}") for i in range(40)
+    ]
+    downloads.append(("http://example.com/missing", Path(temp_dir) / "Image.x"))
+    ApplePanelsProcessor()._download_images(downloads)
+
+    for url, dest in downloads[:-1]:
+        assert dest.read_bytes() == url.encode()
+    assert not downloads[-1][1].exists()
+    assert all(timeout for _, _, timeout in calls)
+    threads_per_session: dict[int, set[int]] = {}
+    for session, thread, _ in calls:
+        threads_per_session.setdefault(session, set()).add(thread)
+    assert all(len(threads) == 1 for threads in threads_per_session.values())
+    assert sorted(closed) == sorted(threads_per_session)
@@ -1,12 +1,16 @@
+import io
 import json
 import os
+import struct
 import tempfile
 import zipfile
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Union
 
 import pytest
 
+from aac_processors import base_processor
 from aac_processors.base_processor import AACProcessor
 from aac_processors.tree_structure import AACTree
 
@@ -79,6 +83,18 @@ def test_session_workspace(test_processor: AACProcessor) -> None:
     assert not os.path.exists(workspace)
 
 
+def test_session_workspace_shared_across_threads(
+    test_processor: AACProcessor,
+) -> None:
+    """Test concurrent first calls on one processor create a single workspace"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        workspaces = set(
+            executor.map(lambda _: test_processor.get_session_workspace(), range(32))
+        )
+    assert len(workspaces) == 1
+    test_processor.cleanup_temp_files()
+
+
 def test_set_source_file(test_processor: AACProcessor, temp_test_file: str) -> None:
     """Test source file setting"""
     test_processor.set_source_file("/path/to/example.test")
@@ -105,6 +121,16 @@ def test_prepare_workspace_archive(
     assert "test.txt" in os.listdir(workspace)
 
 
+def test_prepare_workspace_archive_flag_on_plain_file(
+    test_processor: AACProcessor, temp_test_file: str
+) -> None:
+    """Test a file that is not a zip is copied even when archives are expected"""
+    test_processor.is_archive = True
+    workspace = test_processor._prepare_workspace(temp_test_file)
+    assert os.listdir(workspace) == [os.path.basename(temp_test_file)]
+    test_processor.cleanup_temp_files()
+
+
 def test_get_output_path(test_processor: AACProcessor, temp_test_file: str) -> None:
     """Test output path generation"""
     test_processor.set_source_file(temp_test_file)
@@ -127,6 +153,14 @@ def test_process_texts_extract(
     assert texts == ["test1", "test2"]
 
 
+def test_process_texts_extract_uses_raw_texts(
+    test_processor: AACProcessor, temp_test_file: str
+) -> None:
+    """Test plain extraction goes through the streaming extract_texts_raw"""
+    test_processor.extract_texts_raw = lambda path: iter(["raw"])  # type: ignore
+    assert test_processor.process_texts(temp_test_file) == ["raw"]
+
+
 def test_process_texts_translate(
     test_processor: AACProcessor, temp_test_file: str
 ) -> None:
@@ -140,6 +174,45 @@ def test_process_texts_translate(
         assert saved_translations == translations
 
 
+def test_process_texts_moves_workspace_result(
+    test_processor: AACProcessor, temp_test_file: str, temp_dir: str
+) -> None:
+    """Test a result inside the workspace is moved, not copied, to output_path"""
+    workspace = test_processor.get_session_workspace()
+    result = os.path.join(workspace, "translated.test")
+    with open(result, "w") as f:
+        f.write("translated")
+    test_processor.create_translated_file = lambda *args: result  # type: ignore
+
+    output_path = os.path.join(temp_dir, "output.test")
+    assert test_processor.process_texts(temp_test_file, {}, output_path) == output_path
+    with open(output_path) as f:
+        assert f.read() == "translated"
+    assert not os.path.exists(result)
+    assert os.path.exists(temp_test_file)
+    test_processor.cleanup_temp_files()
+
+
+def test_process_texts_writes_output_directly(
+    test_processor: AACProcessor, temp_test_file: str, temp_dir: str
+) -> None:
+    """Test translation with an output path goes through write_translated_file"""
+    calls = []
+
+    def write_translated_file(
+        file_path: str, translations: dict[str, str], output_path: str
+    ) -> str:
+        calls.append(output_path)
+        return output_path
+
+    test_processor.write_translated_file = write_translated_file  # type: ignore
+    output_path = os.path.join(temp_dir, "direct.test")
+    assert test_processor.process_texts(temp_test_file, {"a": "b"}, output_path) == (
+        output_path
+    )
+    assert calls == [output_path]
+
+
 def test_cleanup(test_processor: AACProcessor) -> None:
     """Test cleanup of temporary files"""
     workspace = test_processor.get_session_workspace()
@@ -149,6 +222,14 @@ def test_cleanup(test_processor: AACProcessor) -> None:
     assert test_processor.temp_dir is None
 
 
+def test_cleanup_missing_workspace(test_processor: AACProcessor) -> None:
+    """Test cleanup forgets a workspace that was already removed"""
+    workspace = test_processor.get_session_workspace()
+    os.rmdir(workspace)
+    test_processor.cleanup_temp_files()
+    assert test_processor.temp_dir is None
+
+
 def test_debug_print(test_processor: AACProcessor) -> None:
     """Test debug print functionality"""
     messages = []
@@ -156,3 +237,229 @@ def test_debug_print(test_processor: AACProcessor) -> None:
     test_processor._debug_print("test message")
     assert len(messages) == 1
     assert messages[0].endswith("test message")
+
+
+def test_create_output_archive(test_processor: AACProcessor, temp_dir: str) -> None:
+    """Test archive output stores images and deflates everything else"""
+    workspace = os.path.join(temp_dir, "workspace")
+    os.makedirs(os.path.join(workspace, "images"))
+    with open(os.path.join(workspace, "board.json"), "w") as f:
+        f.write("{}" * 100)
+    with open(os.path.join(workspace, "images", "icon.png"), "wb") as f:
+        f.write(b"\x89PNG" * 100)
+    open(os.path.join(workspace, "empty.xml"), "w").close()
+
+    test_processor.is_archive = True
+    output_path = os.path.join(temp_dir, "output.zip")
+    test_processor._create_output(workspace, output_path)
+
+    with zipfile.ZipFile(output_path) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+    assert set(infos) == {"board.json", "empty.xml", "images/icon.png"}
+    assert infos["board.json"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["images/icon.png"].compress_type == zipfile.ZIP_STORED
+    assert infos["empty.xml"].compress_type == zipfile.ZIP_STORED
+    assert infos["empty.xml"].file_size == 0
+
+
+def test_context_manager_cleans_workspace(test_processor: AACProcessor) -> None:
+    """Test leaving a with-block removes the session workspace"""
+    with test_processor as processor:
+        workspace = processor.get_session_workspace()
+        assert os.path.exists(workspace)
+    assert not os.path.exists(workspace)
+    assert test_processor.temp_dir is None
+
+
+def test_prepare_workspace_extracts_again(
+    test_processor: AACProcessor, temp_zip_file: str
+) -> None:
+    """Test a second prepare of the same archive discards earlier edits"""
+    test_processor.is_archive = True
+    workspace = test_processor._prepare_workspace(temp_zip_file)
+    extracted = os.path.join(workspace, "test.txt")
+    with open(extracted, "w") as f:
+        f.write("modified")
+
+    assert test_processor._prepare_workspace(temp_zip_file) == workspace
+    with open(extracted) as f:
+        assert f.read() == "test content"
+    test_processor.cleanup_temp_files()
+
+
+def test_fastcopy(test_processor: AACProcessor, temp_dir: str) -> None:
+    """Test fast copy reproduces contents and modification time"""
+    src = os.path.join(temp_dir, "src.bin")
+    dst = os.path.join(temp_dir, "dst.bin")
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    with open(src, "wb") as f:
+        f.write(payload)
+    os.utime(src, (1_000_000, 1_000_000))
+
+    test_processor._fastcopy(src, dst)
+
+    with open(dst, "rb") as f:
+        assert f.read() == payload
+    assert os.stat(dst).st_mtime == os.stat(src).st_mtime
+
+
+@pytest.mark.parametrize("primitive", ["copy_file_range", "sendfile"])
+def test_fastcopy_zero_first_call(
+    test_processor: AACProcessor,
+    temp_dir: str,
+    monkeypatch: pytest.MonkeyPatch,
+    primitive: str,
+) -> None:
+    """Test a kernel copy that copies nothing falls back instead of stopping"""
+    if not hasattr(os, primitive):
+        pytest.skip(f"os.{primitive} is not available")
+    monkeypatch.setattr(os, primitive, lambda *args: 0)
+    src = os.path.join(temp_dir, "src.bin")
+    dst = os.path.join(temp_dir, "dst.bin")
+    payload = os.urandom(64 * 1024 + 3)
+    with open(src, "wb") as f:
+        f.write(payload)
+
+    test_processor._fastcopy(src, dst)
+
+    with open(dst, "rb") as f:
+        assert f.read() == payload
+
+
+def test_create_output_reuses_unchanged_members(
+    test_processor: AACProcessor, temp_dir: str
+) -> None:
+    """Test untouched archive members pass through and edits are picked up"""
+    source = os.path.join(temp_dir, "source.zip")
+    with zipfile.ZipFile(source, "w") as zf:
+        zf.writestr("keep.txt", "unchanged", compress_type=zipfile.ZIP_STORED)
+        zf.writestr("data/edit.txt", "original")
+
+    test_processor.is_archive = True
+    workspace = test_processor._prepare_workspace(source)
+    with open(os.path.join(workspace, "data", "edit.txt"), "w") as f:
+        f.write("edited content")
+    with open(os.path.join(workspace, "new.txt"), "w") as f:
+        f.write("added")
+
+    output_path = os.path.join(temp_dir, "output.zip")
+    test_processor._create_output(workspace, output_path)
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert sorted(zf.namelist()) == ["data/edit.txt", "keep.txt", "new.txt"]
+        assert zf.read("keep.txt") == b"unchanged"
+        assert zf.getinfo("keep.txt").compress_type == zipfile.ZIP_STORED
+        assert zf.read("data/edit.txt") == b"edited content"
+        assert zf.read("new.txt") == b"added"
+    test_processor.cleanup_temp_files()
+
+
+class _UnseekableBuffer(io.BytesIO):
+    """In-memory file that zipfile has to treat as a stream"""
+
+    def seekable(self) -> bool:
+        return False
+
+    def seek(self, *args: Any) -> int:
+        raise io.UnsupportedOperation("seek")
+
+    def tell(self) -> int:
+        raise io.UnsupportedOperation("tell")
+
+
+def test_create_output_copies_compressed_members_verbatim(
+    test_processor: AACProcessor, temp_dir: str
+) -> None:
+    """Test untouched members keep their compressed bytes and marked ones don't"""
+    text = "".join(f"line {i} of some compressible text\n" for i in range(5000))
+    buffer = _UnseekableBuffer()
+    # Written to a stream, so members carry data descriptors
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        zf.writestr("level9.txt", text)
+        zf.writestr("same.txt", "original")
+    source = os.path.join(temp_dir, "source.zip")
+    with open(source, "wb") as f:
+        f.write(buffer.getvalue())
+
+    test_processor.is_archive = True
+    workspace = test_processor._prepare_workspace(source)
+    # Same size and mtime as the extracted copy: only the mark reveals the edit
+    same = os.path.join(workspace, "same.txt")
+    st = os.stat(same)
+    with open(same, "w") as f:
+        f.write("replaced")
+    os.utime(same, ns=(st.st_atime_ns, st.st_mtime_ns))
+    test_processor._mark_modified(same)
+
+    output_path = os.path.join(temp_dir, "output.zip")
+    test_processor._create_output(workspace, output_path)
+
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(output_path) as out:
+        assert out.testzip() is None
+        original = src.getinfo("level9.txt")
+        copied = out.getinfo("level9.txt")
+        assert copied.compress_size == original.compress_size
+        assert copied.CRC == original.CRC
+        assert not copied.flag_bits & 0x08
+        assert out.read("level9.txt") == text.encode()
+        assert out.read("same.txt") == b"replaced"
+    test_processor.cleanup_temp_files()
+
+
+@pytest.mark.parametrize("raw", [True, False])
+def test_copy_archive_member_keeps_metadata(
+    temp_dir: str, monkeypatch: pytest.MonkeyPatch, raw: bool
+) -> None:
+    """Test copied members keep attributes, extra fields and comment"""
+    if not raw:
+        # As on a zipfile without the internals a raw copy needs
+        monkeypatch.setattr(base_processor, "_supports_raw_copy", lambda *args: False)
+    info = zipfile.ZipInfo("script.sh", (2020, 1, 2, 3, 4, 6))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3
+    info.external_attr = 0o100755 << 16
+    info.internal_attr = 1
+    # Extended timestamp field, as written by Info-ZIP
+    info.extra = struct.pack("<HHBL", 0x5455, 5, 1, 1_600_000_000)
+    info.comment = b"entry point"
+    source = os.path.join(temp_dir, "source.zip")
+    with zipfile.ZipFile(source, "w") as zf:
+        zf.writestr(info, "#!/bin/sh\necho hi\n" * 100)
+
+    output_path = os.path.join(temp_dir, "output.zip")
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(output_path, "w") as out:
+        base_processor.copy_archive_member(src, src.getinfo("script.sh"), out)
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.testzip() is None
+        copied = zf.getinfo("script.sh")
+        for name in (
+            "date_time",
+            "compress_type",
+            "create_system",
+            "external_attr",
+            "internal_attr",
+            "extra",
+            "comment",
+            "CRC",
+        ):
+            assert getattr(copied, name) == getattr(info, name), name
+
+
+def test_prepare_workspace_extracts_large_members(
+    test_processor: AACProcessor, temp_dir: str
+) -> None:
+    """Test large members extracted in parallel match the archive contents"""
+    source = os.path.join(temp_dir, "large.zip")
+    payloads = {f"media/file{i}.bin": os.urandom(200 * 1024) for i in range(4)}
+    payloads["small.txt"] = b"small"
+    with zipfile.ZipFile(source, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, payload in payloads.items():
+            zf.writestr(name, payload)
+
+    test_processor.is_archive = True
+    workspace = test_processor._prepare_workspace(source)
+    for name, payload in payloads.items():
+        with open(os.path.join(workspace, name), "rb") as f:
+            assert f.read() == payload
+    test_processor.cleanup_temp_files()
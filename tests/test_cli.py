@@ -49,6 +49,27 @@ def test_complete_path(tmp_path):
     assert result is None
 
 
+def test_complete_path_lists_all_matches(tmp_path):
+    """Test successive completion states walk all matches, directories first"""
+    (tmp_path / "board_b.obf").touch()
+    (tmp_path / "board_a.obf").touch()
+    (tmp_path / "boards").mkdir()
+    (tmp_path / ".board_hidden").touch()
+
+    prefix = str(tmp_path / "board")
+    results = []
+    state = 0
+    while (result := complete_path(prefix, state)) is not None:
+        results.append(result)
+        state += 1
+
+    assert results == [
+        str(tmp_path / "boards") + "/",
+        str(tmp_path / "board_a.obf"),
+        str(tmp_path / "board_b.obf"),
+    ]
+
+
 @pytest.fixture
 def sample_tree():
     """Create a sample AACTree for testing"""
@@ -85,8 +106,11 @@ def test_convert_format(tmp_path, sample_tree, mock_processor):
 
     with (
         patch("aac_processors.cli.get_processor_for_file") as mock_get_processor,
-        patch("aac_processors.cli.GridsetProcessor") as mock_grid_processor,
+        patch("aac_processors.cli._load_processor_class") as mock_load_processor,
     ):
+        mock_grid_processor = MagicMock()
+        mock_load_processor.return_value = mock_grid_processor
+
         # Configure source processor
         mock_get_processor.return_value = mock_processor
 
@@ -100,6 +124,7 @@ def test_convert_format(tmp_path, sample_tree, mock_processor):
         assert result is not None
         assert result.endswith("_converted.test")
         mock_grid_instance.export_tree.assert_called_once()
+        mock_load_processor.assert_called_with(".gridset_processor", "GridsetProcessor")
 
         # Reset mocks for next test
         mock_grid_instance.export_tree.reset_mock()
@@ -5,8 +5,15 @@ import zipfile
 
 import pytest
 
+from aac_processors import _fast_json
 from aac_processors.coughdrop_processor import CoughDropProcessor
-from aac_processors.tree_structure import ButtonType
+from aac_processors.tree_structure import (
+    AACButton,
+    AACPage,
+    AACSymbol,
+    AACTree,
+    ButtonType,
+)
 
 
 @pytest.fixture
@@ -142,6 +149,23 @@ def test_load_single_board(processor, sample_obf_file):
     assert spell_btn.action == "+a"
 
 
+def test_load_button_positions(processor, sample_obf_data, temp_dir):
+    """Test buttons take their first grid order cell, or (0, 0) if absent"""
+    sample_obf_data["grid"]["order"] = [[None, "btn3"], ["btn1", "btn3"]]
+    path = os.path.join(temp_dir, "positions.obf")
+    with open(path, "w") as f:
+        json.dump(sample_obf_data, f)
+
+    page = processor.load_into_tree(path).pages["test_board"]
+    positions = {b.id: b.position for b in page.buttons}
+    assert positions == {
+        "btn1": (1, 0),
+        "btn2": (0, 0),
+        "btn3": (0, 1),
+        "btn4": (0, 0),
+    }
+
+
 def test_load_board_set(processor, sample_obz_file):
     """Test loading an OBZ file with multiple boards"""
     tree = processor.load_into_tree(sample_obz_file)
@@ -231,3 +255,411 @@ def test_process_texts_obz(processor, sample_obz_file):
             board2 = json.loads(zf.read("boards/board2.obf"))
             assert board2["name"] == "Segundo Tablero"
             assert board2["buttons"][0]["label"] == "Volver"
+
+
+def test_save_deduplicates_inline_images(processor):
+    """Test buttons with the same inline image data share one image entry"""
+    page = AACPage(id="page", name="Page", grid_size=(1, 3))
+    # join() gives each button its own string object with equal contents
+    for i, payload in enumerate(["aGVsbG8=", "aGVsbG8=", "d29ybGQ="]):
+        page.buttons.append(
+            AACButton(
+                id=f"btn{i}",
+                label=f"Button {i}",
+                type=ButtonType.SPEAK,
+                position=(0, i),
+                symbol=AACSymbol(data="".join(payload), content_type="image/png"),
+            )
+        )
+    tree = AACTree()
+    tree.add_page(page)
+
+    board = processor._convert_page_to_board(page, tree)
+    assert [image["data"] for image in board["images"]] == [
+        "data:image/png;base64,aGVsbG8=",
+        "data:image/png;base64,d29ybGQ=",
+    ]
+    image_ids = [button["image_id"] for button in board["buttons"]]
+    assert image_ids[0] == image_ids[1] != image_ids[2]
+
+
+def test_extract_obz_without_extracting(processor, sample_obz_file, monkeypatch):
+    """Test OBZ text extraction and loading read boards from the archive"""
+
+    def fail_extractall(*args, **kwargs):
+        raise AssertionError("archive should not be extracted")
+
+    monkeypatch.setattr(zipfile.ZipFile, "extractall", fail_extractall)
+    texts = processor.process_texts(sample_obz_file)
+    assert texts[:2] == ["Test Board", "Hello"]
+    assert "Back" in texts
+    assert set(processor.load_into_tree(sample_obz_file).pages) == {
+        "test_board",
+        "board2",
+    }
+
+
+def test_load_tree_cached(processor, sample_obf_data, temp_dir):
+    """Test cached board trees are reused until the file changes"""
+    path = os.path.join(temp_dir, "cached.obf")
+    with open(path, "w") as f:
+        json.dump(sample_obf_data, f)
+
+    tree = processor._load_tree_cached(path)
+    assert processor._load_tree_cached(path) is tree
+
+    sample_obf_data["name"] = "Renamed Board"
+    with open(path, "w") as f:
+        json.dump(sample_obf_data, f)
+    reloaded = processor._load_tree_cached(path)
+    assert reloaded is not tree
+    assert reloaded.pages["test_board"].name == "Renamed Board"
+
+
+def test_load_boards_cached(processor, sample_obz_file, temp_dir, monkeypatch):
+    """Test an OBZ is parsed once across translations until it is saved over"""
+    reads = []
+    iter_obz_boards = processor._iter_obz_boards
+
+    def counting_iter(file_path):
+        reads.append(file_path)
+        return iter_obz_boards(file_path)
+
+    monkeypatch.setattr(processor, "_iter_obz_boards", counting_iter)
+    for lang in ("es", "fr"):
+        output_path = os.path.join(temp_dir, f"board_{lang}.obz")
+        translations = {"Hello": f"Hello {lang}", "target_lang": lang}
+        assert processor.process_texts(sample_obz_file, translations, output_path)
+    assert processor.extract_texts(sample_obz_file)
+    assert len(reads) == 1
+
+    processor.save_from_tree(processor.load_into_tree(sample_obz_file), sample_obz_file)
+    processor.load_into_tree(sample_obz_file)
+    assert len(reads) == 2
+
+    processor.cleanup_temp_files()
+    processor.load_into_tree(sample_obz_file)
+    assert len(reads) == 3
+
+
+def test_loaded_actions_are_not_shared(processor, sample_obf_data, temp_dir):
+    """Test editing a loaded button's action leaves the cached board intact"""
+    sample_obf_data["buttons"][2]["action"] = {"type": "spelling", "keys": [":clear"]}
+    file_path = os.path.join(temp_dir, "actions.obf")
+    with open(file_path, "w") as f:
+        json.dump(sample_obf_data, f)
+
+    tree = processor.load_into_tree(file_path)
+    button = next(b for b in tree.pages["test_board"].buttons if b.id == "btn3")
+    button.action["keys"].append("+x")
+
+    tree = processor.load_into_tree(file_path)
+    button = next(b for b in tree.pages["test_board"].buttons if b.id == "btn3")
+    assert button.action == {"type": "spelling", "keys": [":clear"]}
+
+
+def test_translated_obz_stores_images(processor, sample_obz_file, temp_dir):
+    """Test repacked OBZ files store images and deflate boards"""
+    with zipfile.ZipFile(sample_obz_file, "a") as zf:
+        zf.writestr("images/hello.png", b"\x89PNG" * 256)
+
+    output_path = os.path.join(temp_dir, "translated.obz")
+    result = processor.process_texts(sample_obz_file, {"Hello": "Hola"}, output_path)
+    assert result == output_path
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.getinfo("images/hello.png").compress_type == zipfile.ZIP_STORED
+        assert zf.read("images/hello.png") == b"\x89PNG" * 256
+        board = zf.getinfo("boards/test_board.obf")
+        assert board.compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_translated_obz_stored_compression(sample_obz_file, temp_dir):
+    """Test obz_compression=ZIP_STORED writes boards uncompressed"""
+    processor = CoughDropProcessor(obz_compression=zipfile.ZIP_STORED)
+    output_path = os.path.join(temp_dir, "stored.obz")
+    processor.process_texts(sample_obz_file, {"Hello": "Hola"}, output_path)
+
+    with zipfile.ZipFile(output_path) as zf:
+        board = zf.getinfo("boards/test_board.obf")
+        assert board.compress_type == zipfile.ZIP_STORED
+        assert b"Hola" in zf.read("boards/test_board.obf")
+    processor.cleanup_temp_files()
+
+
+def test_save_places_out_of_grid_buttons_in_free_cells(processor):
+    """Test buttons outside the grid fill the first free cells in order"""
+    page = AACPage(id="page", name="Page", grid_size=(2, 2))
+    for button_id, position in [
+        ("a", (5, 5)),
+        ("b", (0, 1)),
+        ("c", (-1, 0)),
+        ("d", (1, 0)),
+        ("e", (9, 9)),
+        ("f", (9, 9)),
+    ]:
+        page.buttons.append(
+            AACButton(
+                id=button_id, label=button_id, type=ButtonType.SPEAK, position=position
+            )
+        )
+    tree = AACTree()
+    tree.add_page(page)
+
+    board = processor._convert_page_to_board(page, tree)
+    assert board["grid"]["order"] == [["a", "b"], ["d", "e"]]
+
+
+def test_extract_large_obz_boards_in_order(processor, temp_dir):
+    """Test boards read ahead on worker threads keep manifest order"""
+    path = os.path.join(temp_dir, "large.obz")
+    boards = {}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(4):
+            buttons = [
+                {"id": f"b{i}_{j}", "label": f"Board {i} button {j}"}
+                for j in range(2000)
+            ]
+            board = {"id": f"board{i}", "name": f"Board {i}", "buttons": buttons}
+            boards[f"board{i}"] = f"boards/board{i}.obf"
+            zf.writestr(boards[f"board{i}"], json.dumps(board))
+        zf.writestr("manifest.json", json.dumps({"paths": {"boards": boards}}))
+
+    texts = processor.process_texts(path)
+    assert len(texts) == 4 * 2001
+    assert texts[0] == "Board 0"
+    assert texts[2001] == "Board 1"
+    assert texts[-1] == "Board 3 button 1999"
+
+
+def test_create_translated_obz(processor, sample_obz_file):
+    """Test OBZ translation rewrites boards and copies other members"""
+    with zipfile.ZipFile(sample_obz_file, "a") as zf:
+        zf.writestr(zipfile.ZipInfo("sounds/hello.mp3", (2020, 1, 2, 3, 4, 6)), b"ID3")
+
+    result = processor.create_translated_file(
+        sample_obz_file, {"Hello": "Hola", "Back": "Volver", "target_lang": "es"}
+    )
+    assert result is not None and result.endswith("_es.obz")
+
+    with zipfile.ZipFile(result) as zf:
+        assert zf.getinfo("sounds/hello.mp3").date_time == (2020, 1, 2, 3, 4, 6)
+        assert zf.read("sounds/hello.mp3") == b"ID3"
+        manifest = json.loads(zf.read("manifest.json"))
+        assert manifest["paths"]["boards"]["board2"] == "boards/board2.obf"
+    tree = processor.load_into_tree(result)
+    assert tree.pages["test_board"].buttons[0].label == "Hola"
+    assert tree.pages["board2"].buttons[0].label == "Volver"
+
+
+def test_process_texts_reuses_workspace(processor, sample_obf_file, temp_dir):
+    """Test translations share one scratch workspace that cleanup removes"""
+    translations = {"Hello": "Hola", "target_lang": "es"}
+    workspaces = set()
+    for i in range(2):
+        output_path = os.path.join(temp_dir, f"out{i}.obf")
+        assert processor.process_texts(sample_obf_file, translations, output_path)
+        assert os.path.exists(output_path)
+        workspace = processor.get_session_workspace()
+        assert os.listdir(workspace) == []
+        workspaces.add(workspace)
+    assert len(workspaces) == 1
+
+    processor.cleanup_temp_files()
+    assert not os.path.exists(workspace)
+
+
+def test_save_grid_drops_empty_button_ids(processor):
+    """Test grid cells for buttons without an id are left empty"""
+    page = AACPage(id="page", name="Page", grid_size=(1, 2))
+    for button_id, position in [("", (0, 0)), ("b", (0, 1))]:
+        page.buttons.append(
+            AACButton(id=button_id, label="x", type=ButtonType.SPEAK, position=position)
+        )
+    tree = AACTree()
+    tree.add_page(page)
+
+    assert processor._convert_page_to_board(page, tree)["grid"]["order"] == [
+        [None, "b"]
+    ]
+    page.buttons[0].id = "a"
+    assert processor._convert_page_to_board(page, tree)["grid"]["order"] == [["a", "b"]]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_compact_json(
+    processor, sample_obf_file, temp_dir, monkeypatch, use_orjson
+):
+    """Test boards are saved compactly unless pretty output is asked for"""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_fast_json, "orjson", None)
+    tree = processor.load_into_tree(sample_obf_file)
+    compact_path = os.path.join(temp_dir, "compact.obz")
+    processor.save_from_tree(tree, compact_path)
+    pretty_path = os.path.join(temp_dir, "pretty.obz")
+    processor.save_from_tree(tree, pretty_path, pretty=True)
+
+    names = ("manifest.json", "boards/test_board.obf")
+    with zipfile.ZipFile(compact_path) as zf:
+        compact = {name: zf.read(name) for name in names}
+    with zipfile.ZipFile(pretty_path) as zf:
+        pretty = {name: zf.read(name) for name in names}
+    for name in names:
+        data = json.loads(pretty[name])
+        assert (
+            compact[name]
+            == json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+        )
+        assert pretty[name] == json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def test_write_obz_skips_output_inside_directory(processor, temp_dir):
+    """Test zipping a directory does not add the archive being written"""
+    with open(os.path.join(temp_dir, "manifest.json"), "w") as f:
+        f.write("{}")
+    output_path = os.path.join(temp_dir, "board.obz")
+    processor._write_obz(temp_dir, output_path)
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.namelist() == ["manifest.json"]
+
+
+def test_translate_board_json(processor, sample_obf_data):
+    """Test board JSON is translated on a copy that keeps unknown fields"""
+    sample_obf_data["ext_custom"] = {"keep": True}
+    sample_obf_data["buttons"][0]["vocalization"] = "Hello"
+    original = json.loads(json.dumps(sample_obf_data))
+
+    translated = processor._translate_board_json(
+        sample_obf_data, {"Hello": "Hola", "Test Board": "Tablero"}
+    )
+
+    assert sample_obf_data == original
+    assert translated["name"] == "Tablero"
+    assert translated["ext_custom"] == {"keep": True}
+    assert translated["buttons"][0]["label"] == "Hola"
+    assert translated["buttons"][0]["vocalization"] == "Hola"
+    assert translated["buttons"][1:] == original["buttons"][1:]
+
+
+def test_create_translated_obf_without_copy(processor, sample_obf_file):
+    """Test translating an OBF writes only the result and leaves the source"""
+    with open(sample_obf_file, "rb") as f:
+        original = f.read()
+
+    result = processor.create_translated_file(
+        sample_obf_file, {"Hello": "Hola", "target_lang": "es"}
+    )
+
+    assert os.listdir(os.path.dirname(result)) == [os.path.basename(result)]
+    with open(sample_obf_file, "rb") as f:
+        assert f.read() == original
+    processor.cleanup_temp_files()
+
+
+def test_create_translated_files_in_workdir(processor, sample_obz_file, temp_dir):
+    """Test translations into several languages can share one directory"""
+    results = [
+        processor.create_translated_file(
+            sample_obz_file, {"Hello": "Hola", "target_lang": lang}, workdir=temp_dir
+        )
+        for lang in ("es", "fr")
+    ]
+
+    assert [os.path.dirname(result) for result in results] == [temp_dir] * 2
+    assert results[0] != results[1]
+    processor.cleanup_temp_files()
+    assert all(os.path.exists(result) for result in results)
+
+
+@pytest.mark.parametrize("extension", [".obz", ".obf"])
+def test_save_empty_tree(processor, temp_dir, extension):
+    """Test saving a tree without pages fails before creating the output"""
+    output_path = os.path.join(temp_dir, f"empty{extension}")
+    with pytest.raises(ValueError, match="No pages to save"):
+        processor.save_from_tree(AACTree(), output_path)
+    assert not os.path.exists(output_path)
+
+
+def test_process_files_skips_missing_boards(processor, sample_obf_data, temp_dir):
+    """Test boards listed in the manifest but missing on disk are skipped"""
+    os.makedirs(os.path.join(temp_dir, "boards"))
+    with open(os.path.join(temp_dir, "boards", "test_board.obf"), "w") as f:
+        json.dump(sample_obf_data, f)
+    manifest = {
+        "paths": {
+            "boards": {
+                "missing": "boards/missing.obf",
+                "test_board": "boards/test_board.obf",
+            }
+        }
+    }
+    with open(os.path.join(temp_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+
+    assert processor.process_files(temp_dir) is None
+    assert "Hello" in processor.collected_texts
+
+
+def test_translated_obz_copies_other_members(processor, sample_obz_file, temp_dir):
+    """Test members other than boards are copied verbatim with their metadata"""
+    payload = b"".join(b"note %d\n" % i for i in range(30000))
+    info = zipfile.ZipInfo("notes/readme.txt", (2020, 1, 2, 3, 4, 6))
+    info.external_attr = 0o600 << 16
+    with zipfile.ZipFile(sample_obz_file, "a") as zf:
+        zf.writestr(info, payload, zipfile.ZIP_DEFLATED, compresslevel=9)
+        zf.writestr("images/empty.svg", b"")
+
+    output_path = os.path.join(temp_dir, "translated.obz")
+    processor.process_texts(sample_obz_file, {"Hello": "Hola"}, output_path)
+
+    with zipfile.ZipFile(sample_obz_file) as src, zipfile.ZipFile(output_path) as zf:
+        original = src.getinfo("notes/readme.txt")
+        copied = zf.getinfo("notes/readme.txt")
+        assert zf.read(copied) == payload
+        assert copied.date_time == info.date_time
+        assert copied.external_attr == info.external_attr
+        # Not recompressed at ARCHIVE_COMPRESSLEVEL
+        assert copied.compress_size == original.compress_size
+        assert copied.CRC == original.CRC
+        assert zf.getinfo("images/empty.svg").compress_type == zipfile.ZIP_STORED
+        assert zf.read("images/empty.svg") == b""
+
+
+def test_translated_obz_keeps_member_compression(processor, sample_obz_file, temp_dir):
+    """Test copied members keep their source compression method"""
+    with zipfile.ZipFile(sample_obz_file, "a") as zf:
+        # The opposite of what set_member_compression would pick for them
+        zf.writestr("images/photo.png", b"\x89PNG" * 4096, zipfile.ZIP_DEFLATED)
+        zf.writestr("notes/readme.txt", b"stored text " * 4096, zipfile.ZIP_STORED)
+
+    output_path = os.path.join(temp_dir, "translated.obz")
+    processor.process_texts(sample_obz_file, {"Hello": "Hola"}, output_path)
+
+    with zipfile.ZipFile(output_path) as zf:
+        assert zf.getinfo("images/photo.png").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("notes/readme.txt").compress_type == zipfile.ZIP_STORED
+        assert zf.read("images/photo.png") == b"\x89PNG" * 4096
+        assert zf.read("notes/readme.txt") == b"stored text " * 4096
+
+
+def test_extract_texts_raw_matches_tree(processor, sample_obz_file):
+    """Test texts streamed from board JSON match those collected from a tree"""
+    processor._collect_tree_texts(processor.load_into_tree(sample_obz_file))
+    from_tree = processor.collected_texts
+
+    assert list(processor.extract_texts_raw(sample_obz_file)) == from_tree
+    assert processor.extract_texts(sample_obz_file) == from_tree
+
+
+def test_process_texts_obz_without_manifest(processor, temp_dir):
+    """Test extracting from an OBZ without a manifest finds no texts"""
+    file_path = os.path.join(temp_dir, "no_manifest.obz")
+    with zipfile.ZipFile(file_path, "w") as zf:
+        zf.writestr("boards/board.obf", json.dumps({"id": "b", "name": "Board"}))
+
+    assert processor.process_texts(file_path) == []
+    with pytest.raises(ValueError, match="missing manifest.json"):
+        processor.load_into_tree(file_path)
@@ -0,0 +1,52 @@
+import io
+import json
+
+import pytest
+
+from aac_processors import _fast_json
+
+BOARD = {
+    "id": "1",
+    "name": "Café",
+    "buttons": [{"id": "b1", "label": "hello", "background_color": None}],
+    "grid": {"rows": 1, "columns": 1, "order": [["b1"]]},
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_fast_json, "orjson", None)
+    return request.param
+
+
+def test_round_trip(backend: str) -> None:
+    fp = io.BytesIO()
+    _fast_json.dump(BOARD, fp, indent=True)
+    assert b"\n  " in fp.getvalue()
+    assert "Café".encode() in fp.getvalue()
+    fp.seek(0)
+    assert _fast_json.load(fp) == BOARD
+    assert json.loads(_fast_json.dumps(BOARD)) == BOARD
+
+
+def test_values_orjson_rejects(backend: str) -> None:
+    value = _fast_json.loads(b'{"x": NaN}')["x"]
+    assert value != value
+    assert _fast_json.dumps({"big": 2**70}) == b'{"big":1180591620717411303424}'
+
+
+def test_invalid_document(backend: str) -> None:
+    with pytest.raises(ValueError):
+        _fast_json.loads(b'{"id": ')
+
+
+def test_dumps_exact_output(backend: str) -> None:
+    data = {"a": [1, 2], "b": "Café", "c": {}}
+    assert _fast_json.dumps(data) == '{"a":[1,2],"b":"Café","c":{}}'.encode()
+    assert _fast_json.dumps(data, indent=True) == (
+        '{\n  "a": [\n    1,\n    2\n  ],\n  "b": "Café",\n  "c": {}\n}'.encode()
+    )
@@ -0,0 +1,76 @@
+import io
+import plistlib
+from datetime import datetime
+
+import pytest
+from lxml import etree
+
+from aac_processors._fast_plist import load, load_xml
+
+SAMPLE = {
+    "Panels": {
+        "Panel.1": {
+            "Name": "Home",
+            "DisplayOrder": 1,
+            "HideHome": False,
+            "UsesPinnedResizing": True,
+            "GlidingLensSize": 5.5,
+            "PanelObjects": [
+                {"ID": "Button.1", "DisplayText": "", "Rect": "{{0, 0}, {100, 25}}"},
+                {"ID": "Button.2", "DisplayText": "Héllo & <bye>"},
+            ],
+        }
+    },
+    "Created": datetime(2024, 1, 2, 3, 4, 5),
+    "Blob": b"\x00\x01binary",
+    "Empty": [],
+    "Nested": [[1, -2], {}],
+}
+
+
+def test_load_xml_matches_plistlib() -> None:
+    data = plistlib.dumps(SAMPLE, fmt=plistlib.FMT_XML)
+    assert load(io.BytesIO(data)) == plistlib.loads(data)
+
+
+def test_load_binary_falls_back_to_plistlib() -> None:
+    data = plistlib.dumps(SAMPLE, fmt=plistlib.FMT_BINARY)
+    assert load(io.BytesIO(data)) == SAMPLE
+
+
+def test_load_xml_hex_integer_and_partial_date() -> None:
+    data = (
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<plist version="1.0"><dict>'
+        b"<key>a</key><integer>0x1F</integer>"
+        b"<key>b</key><date>2024-05Z</date>"
+        b"</dict></plist>"
+    )
+    assert load_xml(io.BytesIO(data)) == {"a": 31, "b": datetime(2024, 5, 1)}
+
+
+def test_load_xml_rejects_missing_value() -> None:
+    data = b"<plist><dict><key>a</key></dict></plist>"
+    with pytest.raises(ValueError):
+        load_xml(io.BytesIO(data))
+
+
+def test_load_xml_text_split_by_comment_and_pi() -> None:
+    data = (
+        b"<plist><dict>"
+        b"<key>a<!--c-->b</key><string>x<!--c-->y<?pi z?>w</string>"
+        b"</dict></plist>"
+    )
+    assert load_xml(io.BytesIO(data)) == plistlib.loads(data) == {"ab": "xyw"}
+
+
+def test_load_xml_keeps_parser_limits() -> None:
+    blob = bytes(range(256)) * 4 * 1024
+    data = plistlib.dumps({"Blob": blob}, fmt=plistlib.FMT_XML)
+    assert load_xml(io.BytesIO(data)) == {"Blob": blob}
+
+    # Text nodes past libxml2's default limit are refused, not buffered
+    blob = bytes(range(256)) * 64 * 1024
+    data = plistlib.dumps({"Blob": blob}, fmt=plistlib.FMT_XML)
+    with pytest.raises(etree.XMLSyntaxError):
+        load_xml(io.BytesIO(data))
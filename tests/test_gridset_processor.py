@@ -82,6 +82,15 @@ def test_save_tree(test_gridset: str, temp_dir: str) -> None:
         assert text.text == "Test Word"
 
 
+def test_extract_texts_raw(test_gridset: str) -> None:
+    processor = GridsetProcessor()
+    texts = list(processor.extract_texts_raw(test_gridset))
+
+    # Grid names, captions and word list items, each reported once
+    assert len(texts) == len(set(texts))
+    assert {"Test Grid", "Test Button", "Test List", "Test Word"} <= set(texts)
+
+
 def test_translation(test_gridset, temp_dir):
     processor = GridsetProcessor()
 
@@ -0,0 +1,52 @@
+import os
+import zipfile
+import zlib
+
+import pytest
+
+from aac_processors import _zip_accel
+
+isal_zlib = pytest.importorskip("isal.isal_zlib")
+
+
+def test_fast_levels_use_isal(temp_dir: str) -> None:
+    path = os.path.join(temp_dir, "board.zip")
+    with _zip_accel.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        with zf.open("fast.txt", "w") as dst:
+            compressor = dst._compressor  # type: ignore[attr-defined]
+        assert isinstance(compressor, isal_zlib.Compress)
+
+        # Levels ISA-L does not implement stay on zlib
+        info = zipfile.ZipInfo("best.txt")
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info._compresslevel = 9  # type: ignore[attr-defined]
+        with zf.open(info, "w") as dst:
+            compressor = dst._compressor  # type: ignore[attr-defined]
+        assert isinstance(compressor, type(zlib.compressobj()))
+
+    with _zip_accel.ZipFile(path) as zf, zf.open("fast.txt") as src:
+        decompressor = src._decompressor  # type: ignore[attr-defined]
+    assert isinstance(decompressor, isal_zlib.Decompress)
+
+
+def test_zipfile_module_untouched() -> None:
+    # Importing the processors must not change archives opened elsewhere
+    import aac_processors  # noqa: F401
+
+    assert zipfile.zlib is zlib  # type: ignore[attr-defined]
+
+
+def test_archive_round_trip(temp_dir: str) -> None:
+    payload = b"".join(b"button %d\n" % i for i in range(20000)) + os.urandom(4096)
+    path = os.path.join(temp_dir, "board.zip")
+    with _zip_accel.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("fast.txt", payload)
+    with _zip_accel.ZipFile(path, "a", zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        zf.writestr("best.txt", payload)
+
+    # Readable both with and without isal
+    for cls in (zipfile.ZipFile, _zip_accel.ZipFile):
+        with cls(path) as zf:
+            assert zf.testzip() is None
+            assert zf.read("fast.txt") == payload
+            assert zf.read("best.txt") == payload